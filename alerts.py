@@ -0,0 +1,142 @@
+import threading
+
+import numpy as np
+
+from events import DANGER
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: DANGER ALERT HYSTERESIS
+# ----------------------------------------------------------------------
+
+# Weight of the newest window in each child's running DANGER probability;
+# 0.2 remembers roughly the last five windows (25 s).
+ALERT_SMOOTHING = 0.2
+
+# The running probability must reach ALERT_ENTER to raise an alert and
+# fall to ALERT_EXIT to clear it, so a child hovering around one
+# threshold does not flap between alarm and all-clear.
+ALERT_ENTER = 0.6
+ALERT_EXIT = 0.3
+
+# A single window at least this sure of DANGER raises the alert on its
+# own, so smoothing never delays a clear-cut alarm; it still takes a run
+# of calm windows to clear.
+ALERT_INSTANT = 0.9
+
+INITIAL_CAPACITY = 1024
+
+class DangerAlertFilter:
+    """Per-child alert state over a stream of scored windows.
+
+    Each child gets a slot in flat arrays holding an EWMA of its DANGER
+    probability and whether its alert is active. update() takes one
+    window per child for any number of children and touches only their
+    slots, so each window costs O(1) and a batch is a handful of
+    vectorized array operations.
+    """
+
+    def __init__(self, smoothing=ALERT_SMOOTHING, enter=ALERT_ENTER, exit=ALERT_EXIT,
+                 instant=ALERT_INSTANT, capacity=INITIAL_CAPACITY):
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+        if not 0.0 <= exit < enter <= instant <= 1.0:
+            raise ValueError("Thresholds must satisfy 0 <= exit < enter <= instant <= 1")
+        self.smoothing = smoothing
+        self.enter = enter
+        self.exit = exit
+        self.instant = instant
+        self.lock = threading.Lock()
+        self.slots = {}
+        self.score = np.zeros(max(capacity, 1))
+        self.active = np.zeros(max(capacity, 1), dtype=bool)
+        self.windows = 0
+        self.alerts_raised = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def update(self, child_ids, danger_probability):
+        """Fold one window per child into its alert state.
+
+        Returns (active, raised), boolean arrays aligned with child_ids;
+        `raised` marks alerts that started with this window, which are
+        the only ones that should notify anyone.
+        """
+        probability = np.asarray(danger_probability, dtype=np.float64).ravel()
+        if len(probability) != len(child_ids):
+            raise ValueError(f"Got {len(child_ids)} child ids for {len(probability)} probabilities")
+
+        with self.lock:
+            slots = self._slots(child_ids)
+            if len(np.unique(slots)) != len(slots):
+                raise ValueError("Each child may appear at most once per update")
+
+            score = self.score[slots]
+            score += self.smoothing * (probability - score)
+            # Fast attack, slow release: a clear-cut window lifts the
+            # average to its own probability, which then has to decay
+            # through ALERT_EXIT before the alert can clear.
+            instant = probability >= self.instant
+            score[instant] = np.maximum(score[instant], probability[instant])
+            was_active = self.active[slots]
+            active = np.where(was_active, score > self.exit, score >= self.enter)
+            self.score[slots] = score
+            self.active[slots] = active
+
+            raised = active & ~was_active
+            self.windows += len(slots)
+            self.alerts_raised += int(np.count_nonzero(raised))
+        return active, raised
+
+    def is_active(self, child_id):
+        with self.lock:
+            slot = self.slots.get(child_id)
+            return slot is not None and bool(self.active[slot])
+
+    def danger_score(self, child_id):
+        """A child's smoothed DANGER probability, or None if it has no windows yet."""
+        with self.lock:
+            slot = self.slots.get(child_id)
+            return None if slot is None else float(self.score[slot])
+
+    def clear(self, child_id):
+        """Reset a child, e.g. once a parent has confirmed it is safe."""
+        with self.lock:
+            slot = self.slots.get(child_id)
+            if slot is not None:
+                self.score[slot] = 0.0
+                self.active[slot] = False
+
+    def stats(self):
+        with self.lock:
+            return {
+                'children': len(self.slots),
+                'windows': self.windows,
+                'alerts_raised': self.alerts_raised,
+                'active_alerts': int(np.count_nonzero(self.active[:len(self.slots)]))
+            }
+
+    def _slots(self, child_ids):
+        slots = np.empty(len(child_ids), dtype=np.intp)
+        for i, child_id in enumerate(child_ids):
+            slot = self.slots.get(child_id)
+            if slot is None:
+                slot = self.slots[child_id] = len(self.slots)
+            slots[i] = slot
+
+        if len(self.slots) > len(self.score):
+            capacity = max(len(self.slots), 2 * len(self.score))
+            self.score = np.concatenate([self.score, np.zeros(capacity - len(self.score))])
+            self.active = np.concatenate([self.active, np.zeros(capacity - len(self.active), dtype=bool)])
+        return slots
+
+def danger_probability(model, probabilities):
+    """The DANGER column of predict_proba output (zeros if the model lacks it)."""
+    probabilities = np.asarray(probabilities)
+    if probabilities.ndim == 1:
+        probabilities = probabilities.reshape(1, -1)
+    column = np.flatnonzero(np.asarray(model.classes_) == DANGER)
+    if len(column) == 0:
+        return np.zeros(len(probabilities))
+    return probabilities[:, column[0]]
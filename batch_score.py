@@ -0,0 +1,261 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from features import WINDOW_SIZE
+from inference import LABELS, default_model_path, featurize, load_model_file, score_batch_proba
+from replay import CHUNK_SAMPLES, TraceWindower, iter_trace
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: COLUMNAR OUTPUT
+# ----------------------------------------------------------------------
+
+# Per input trace, predictions land in <output>/<trace name>/ as one .npy
+# file per column, the same layout sensors.write_workload uses.
+OUTPUT_COLUMNS = ['child_id', 'window_index', 'timestamp', 'prediction', 'confidence', 'probabilities']
+MANIFEST = 'manifest.json'
+
+# Every chunk of a column must share one dtype, whatever pandas or
+# pyarrow inferred for that chunk alone (a chunk with a missing value
+# reads as float64), so two columns have a fixed schema:
+# - child_id: text ids fixed-width TEXT_ID_DTYPE, numeric ids int64 with
+#   MISSING_CHILD_ID where the id is missing.
+# - timestamp: int64 nanoseconds since the epoch (UTC), NaT's int64 value
+#   where missing. Text and datetimes are parsed; numbers are taken to
+#   be nanoseconds already, like the journal's ts_ns.
+TEXT_ID_DTYPE = 'U64'
+MISSING_CHILD_ID = -1
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+COPY_ROWS = 1000000
+
+class ColumnWriter:
+    """Append-only writer for a directory of .npy columns.
+
+    The row count is unknown until the trace is exhausted, so each column
+    is appended to a raw .part file and turned into a .npy on close().
+    Memory stays bounded by one chunk of windows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.files = {}
+        self.layouts = {}
+        self.rows = 0
+
+    def append(self, columns):
+        for name, values in columns.items():
+            values = np.ascontiguousarray(values)
+            if values.dtype.hasobject:
+                raise ValueError(f"Column {name!r} holds Python objects; convert it to a fixed-width dtype first")
+            if name not in self.files:
+                self.files[name] = open(self._part(name), 'wb')
+                self.layouts[name] = (values.dtype, values.shape[1:])
+            dtype, tail = self.layouts[name]
+            if values.shape[1:] != tail:
+                raise ValueError(f"Column {name!r} changed shape from {tail} to {values.shape[1:]} between chunks")
+            if values.dtype != dtype:
+                # Raw bytes of another dtype would be read back as garbage.
+                if not np.can_cast(values.dtype, dtype, casting='same_kind'):
+                    raise ValueError(f"Column {name!r} changed dtype from {dtype} to {values.dtype} between chunks")
+                values = values.astype(dtype)
+            values.tofile(self.files[name])
+        self.rows += len(next(iter(columns.values())))
+
+    def close(self):
+        for name, part in self.files.items():
+            part.close()
+            dtype, tail = self.layouts[name]
+            column = np.lib.format.open_memmap(os.path.join(self.path, f"{name}.npy"), mode='w+',
+                                               dtype=dtype, shape=(self.rows,) + tail)
+            items = int(np.prod(tail, dtype=np.int64))
+            with open(self._part(name), 'rb') as f:
+                for start in range(0, self.rows, COPY_ROWS):
+                    count = min(COPY_ROWS, self.rows - start)
+                    column[start:start + count] = np.fromfile(f, dtype=dtype, count=count * items).reshape((count,) + tail)
+            column.flush()
+            del column
+            os.remove(self._part(name))
+        self.files = {}
+
+    def discard(self):
+        """Drop everything written so far, e.g. when the trace fails part-way."""
+        for part in self.files.values():
+            part.close()
+        self.files = {}
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _part(self, name):
+        return os.path.join(self.path, f"{name}.part")
+
+def child_id_column(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        return values.astype(np.int64)
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        if np.any(values[~missing] != np.round(values[~missing])):
+            raise ValueError("Numeric child ids must be whole numbers")
+        return np.where(missing, MISSING_CHILD_ID, values).astype(np.int64)
+    return values.astype(TEXT_ID_DTYPE)
+
+def timestamp_column(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        return values.astype(np.int64)
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        return np.where(missing, MISSING_TIMESTAMP, np.round(np.where(missing, 0, values))).astype(np.int64)
+    import pandas as pd
+    # NaT comes out as MISSING_TIMESTAMP.
+    return pd.to_datetime(values, utc=True).to_numpy().astype('datetime64[ns]').astype(np.int64)
+
+# ----------------------------------------------------------------------
+# SECTION 2: WORKERS
+# ----------------------------------------------------------------------
+
+# Set once per worker process by init_worker, so the model is loaded
+# once per worker rather than once per trace.
+_model = None
+
+def init_worker(model_path):
+    global _model
+    _model = load_model_file(model_path)
+
+def score_trace(path, output, window=WINDOW_SIZE, step=None, chunk_samples=CHUNK_SAMPLES):
+    """Window, featurize and score one trace file into a column directory."""
+    start = time.perf_counter()
+    windower = TraceWindower(window, step)
+    writer = ColumnWriter(output)
+    samples = 0
+    label_counts = np.zeros(len(LABELS), dtype=np.int64)
+
+    try:
+        for chunk in iter_trace(path, chunk_samples):
+            samples += len(chunk['heart_rate'])
+            cut = windower.push(chunk)
+            if cut is None:
+                continue
+            X = featurize(_model, cut['heart_rate'], cut['accelerometer'])
+            predictions, confidences, probabilities = score_batch_proba(_model, X)
+            label_counts += np.bincount(np.searchsorted(_model.classes_, predictions),
+                                        minlength=len(LABELS))[:len(LABELS)]
+
+            columns = {'child_id': child_id_column(cut['child_id']), 'window_index': cut['window_index']}
+            if 'timestamp' in cut:
+                columns['timestamp'] = timestamp_column(cut['timestamp'])
+            columns['prediction'] = predictions.astype(np.int8)
+            columns['confidence'] = confidences.astype(np.float32)
+            columns['probabilities'] = probabilities.astype(np.float32)
+            writer.append(columns)
+        writer.close()
+    except BaseException:
+        writer.discard()
+        raise
+
+    return {
+        'trace': path,
+        'output': output,
+        'samples': samples,
+        'windows': writer.rows,
+        'dropped_samples': windower.dropped_samples(),
+        'predictions': {LABELS[i]: int(count) for i, count in enumerate(label_counts)},
+        'seconds': time.perf_counter() - start
+    }
+
+# ----------------------------------------------------------------------
+# SECTION 3: SHARDING
+# ----------------------------------------------------------------------
+
+def trace_name(path):
+    name = os.path.basename(os.path.normpath(path))
+    for suffix in ('.csv.gz', '.csv', '.parquet', '.pq', '.npy'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+def score_traces(paths, output, model_path, jobs=None, window=WINDOW_SIZE, step=None,
+                 chunk_samples=CHUNK_SAMPLES, progress=None):
+    """Score every trace across a process pool; one trace is one shard.
+
+    Traces are submitted largest first so a big file does not start last
+    and leave the other workers idle at the end.
+    """
+    names = [trace_name(path) for path in paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Traces must have distinct names, got duplicates: {', '.join(duplicates)}")
+
+    def size(path):
+        if os.path.isdir(path):
+            return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+        return os.path.getsize(path)
+
+    os.makedirs(output, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    order = sorted(range(len(paths)), key=lambda i: size(paths[i]), reverse=True)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths)) or 1,
+                             initializer=init_worker, initargs=(model_path,)) as pool:
+        futures = [
+            pool.submit(score_trace, paths[i], os.path.join(output, names[i]), window, step, chunk_samples)
+            for i in order
+        ]
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BaseException:
+                # Traces not yet started are skipped; a failed trace has
+                # already removed its own partial output.
+                for pending in futures:
+                    pending.cancel()
+                raise
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    results.sort(key=lambda r: r['trace'])
+    manifest = {'model': model_path, 'window': window, 'step': step or window, 'columns': OUTPUT_COLUMNS,
+                'labels': [LABELS[i] for i in range(len(LABELS))], 'traces': results}
+    with open(os.path.join(output, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return results
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Score recorded SWIRI traces in parallel")
+    parser.add_argument('traces', nargs='+', help="Trace files (.csv, .parquet, .npy) or directories of .npy columns")
+    parser.add_argument('--output', required=True, help="Directory for per-trace prediction columns")
+    parser.add_argument('--model', default=None, help="Model path (default: flat export if present, else the pickle)")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk', type=int, default=CHUNK_SAMPLES, help="Samples read per chunk")
+    parser.add_argument('--step', type=int, default=None, help="Samples between window starts (default: window size)")
+    args = parser.parse_args()
+
+    def progress(result):
+        print(f"{result['trace']}: {result['windows']:,} windows in {result['seconds']:.2f} s", file=sys.stderr)
+
+    start = time.perf_counter()
+    results = score_traces(args.traces, args.output, args.model or default_model_path(), args.jobs,
+                           step=args.step, chunk_samples=args.chunk, progress=progress)
+    seconds = time.perf_counter() - start
+
+    samples = sum(r['samples'] for r in results)
+    windows = sum(r['windows'] for r in results)
+    print(f"Scored {len(results)} traces, {samples:,} samples into {windows:,} windows in {seconds:.2f} s "
+          f"({samples / seconds:,.0f} samples/s)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,391 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from events import EventStore
+from features import FEATURE_ORDER, compute_features, compute_features_batch
+from flat_forest import FlatForest, is_flat_model, save_flat_model
+from inference import FLAT_MODEL_PATH, MODEL_PATH, load_model_file, score_batch
+from journal import EventJournal
+from sensors import generate_sensor_data, generate_windows
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: SYNTHETIC FEATURE WINDOWS
+# ----------------------------------------------------------------------
+
+def random_feature_matrix(n, seed=0):
+    # Spread rows across the NORMAL / PLAYING / DANGER feature ranges so
+    # every tree path gets exercised, not just one leaf.
+    rng = np.random.default_rng(seed)
+    hr_mean = rng.uniform(80, 160, n)
+    hr_gradient = rng.uniform(-5, 30, n)
+    acc_mean = rng.uniform(0, 5, n)
+    acc_variance = rng.uniform(0, 3, n)
+    return np.column_stack([hr_mean, hr_gradient, acc_mean, acc_variance])
+
+def time_call(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def measure(fn, repeats, min_seconds=0.02):
+    # Calls that finish in microseconds are looped so each sample spans
+    # at least min_seconds and timer resolution doesn't dominate.
+    start = time.perf_counter()
+    fn()
+    once = time.perf_counter() - start
+    loops = max(1, int(min_seconds / once)) if once > 0 else 1000
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return min(samples), float(np.median(samples))
+
+# ----------------------------------------------------------------------
+# SECTION 2: BATCH THROUGHPUT
+# ----------------------------------------------------------------------
+
+def bench_batch(model, batch_sizes, repeats):
+    results = []
+    for n in batch_sizes:
+        X = random_feature_matrix(n)
+        seconds = time_call(lambda: score_batch(model, X), repeats)
+        results.append({
+            'batch_size': n,
+            'seconds': seconds,
+            'windows_per_second': n / seconds
+        })
+    return results
+
+# ----------------------------------------------------------------------
+# SECTION 3: FLAT FOREST VS SKLEARN
+# ----------------------------------------------------------------------
+
+def bench_flat(model, batch_sizes, repeats):
+    flat = FlatForest.from_sklearn(model)
+    results = []
+    for n in batch_sizes:
+        X = random_feature_matrix(n)
+        if not np.array_equal(model.predict_proba(X), flat.predict_proba(X)):
+            raise AssertionError(f"FlatForest probabilities differ from sklearn at batch={n}")
+        sklearn_seconds = time_call(lambda: model.predict_proba(X), repeats)
+        flat_seconds = time_call(lambda: flat.predict_proba(X), repeats)
+        results.append({
+            'batch_size': n,
+            'sklearn_seconds': sklearn_seconds,
+            'flat_seconds': flat_seconds,
+            'speedup': sklearn_seconds / flat_seconds
+        })
+    return results
+
+# ----------------------------------------------------------------------
+# SECTION 4: COLD START
+# ----------------------------------------------------------------------
+
+STARTUP_SNIPPET = """
+import time, warnings
+start = time.perf_counter()
+warnings.simplefilter('ignore')
+from inference import load_model_file
+model = load_model_file({path!r})
+model.predict_proba([[85.0, 2.0, 0.5, 0.01]])
+print(time.perf_counter() - start)
+"""
+
+def bench_startup(paths, repeats):
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for label, path in paths:
+        load_seconds, process_seconds = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, '-c', STARTUP_SNIPPET.format(path=path)],
+                cwd=here, check=True, capture_output=True, text=True
+            ).stdout
+            process_seconds.append(time.perf_counter() - start)
+            load_seconds.append(float(output.strip().splitlines()[-1]))
+        results.append({
+            'format': label,
+            'path': path,
+            'load_seconds': float(np.median(load_seconds)),
+            'process_seconds': float(np.median(process_seconds))
+        })
+    return results
+
+# The whole app, run once through AppTest in a fresh interpreter, lands
+# on the Home page (the menu's default). Reports how long that first run
+# took and which heavy libraries it pulled in.
+HOME_SNIPPET = """
+import json, sys, time, warnings
+warnings.simplefilter('ignore')
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+at = AppTest.from_file('app.py', default_timeout=60).run()
+seconds = time.perf_counter() - start
+print(json.dumps({'run_seconds': seconds, 'exception': bool(at.exception),
+                  'modules': [name for name in sys.argv[1:] if name in sys.modules]}))
+"""
+HOME_HEAVY_MODULES = ['pandas', 'sklearn', 'joblib']
+
+def bench_home(repeats, modules=HOME_HEAVY_MODULES):
+    here = os.path.dirname(os.path.abspath(__file__))
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, '-c', HOME_SNIPPET, *modules],
+            cwd=here, check=True, capture_output=True, text=True
+        ).stdout
+        run = json.loads(output.strip().splitlines()[-1])
+        run['process_seconds'] = time.perf_counter() - start
+        runs.append(run)
+    return runs
+
+# ----------------------------------------------------------------------
+# SECTION 5: PIPELINE SUITE
+# ----------------------------------------------------------------------
+
+SUITE_WINDOW_SIZES = [50, 500, 5000]
+SUITE_BATCH_SIZES = [1, 100, 10000, 100000]
+
+# Window x batch combinations above this many samples per array are
+# skipped so the suite fits in a few GB of RAM.
+SUITE_MAX_SAMPLES = 20000000
+
+def suite_row(stage, window, batch, timing):
+    best, median = timing
+    return {
+        'stage': stage,
+        'window': window,
+        'batch': batch,
+        'best_seconds': best,
+        'median_seconds': median,
+        'windows_per_second': batch / best
+    }
+
+def bench_suite(model, window_sizes, batch_sizes, repeats, max_samples=SUITE_MAX_SAMPLES):
+    rng = np.random.default_rng(0)
+    flat = FlatForest.from_sklearn(model) if hasattr(model, 'estimators_') else model
+    results = []
+
+    # Events go to the in-memory store and then to a journal, as
+    # views.common.log_event does. The journal is not fsync'd here (the
+    # flush runs on its own thread, off the page's path); log_event_fsync
+    # times the same event flushed to disk before returning.
+    scratch = tempfile.TemporaryDirectory()
+    events = EventStore()
+    journal = EventJournal(os.path.join(scratch.name, 'events.jsonl'), fsync=False)
+    durable = EventJournal(os.path.join(scratch.name, 'durable.jsonl'))
+
+    def log_event(details, **fields):
+        journal.append(events.log("AI_PROCESSING", details, **fields))
+
+    def log_event_fsync():
+        durable.append(events.log("AI_PROCESSING", "Prediction: DANGER", prediction=2, confidence=97.5, features=features))
+        durable.flush()
+
+    # Single-window helpers exactly as the Smartwatch / AI Engine pages call them.
+    hr, acc = generate_sensor_data("DANGER", rng=rng)
+    features = [compute_features(hr, acc)[name] for name in FEATURE_ORDER]
+    results.append(suite_row('generate_sensor_data', 50, 1, measure(lambda: generate_sensor_data("DANGER", rng=rng), repeats)))
+    results.append(suite_row('compute_features', 50, 1, measure(lambda: compute_features(hr, acc), repeats)))
+    results.append(suite_row('log_event', 0, 1, measure(
+        lambda: log_event("Prediction: DANGER", prediction=2, confidence=97.5, features=features), repeats)))
+    results.append(suite_row('log_event_fsync', 0, 1, measure(log_event_fsync, repeats)))
+
+    for window in window_sizes:
+        for batch in batch_sizes:
+            if window * batch > max_samples:
+                continue
+            codes = rng.integers(0, 3, batch)
+            hr_windows, acc_windows = generate_windows(codes, rng, window=window)
+            X = compute_features_batch(hr_windows, acc_windows)
+
+            results.append(suite_row('generate_windows', window, batch,
+                                     measure(lambda: generate_windows(codes, rng, window=window), repeats)))
+            results.append(suite_row('compute_features_batch', window, batch,
+                                     measure(lambda: compute_features_batch(hr_windows, acc_windows), repeats)))
+            if window == window_sizes[0]:
+                results.append(suite_row('score_batch_sklearn', window, batch,
+                                         measure(lambda: score_batch(model, X), repeats)))
+                results.append(suite_row('score_batch_flat', window, batch,
+                                         measure(lambda: score_batch(flat, X), repeats)))
+
+            def end_to_end():
+                hr_w, acc_w = generate_windows(codes, rng, window=window)
+                predictions, _ = score_batch(model, compute_features_batch(hr_w, acc_w))
+                danger = int(np.count_nonzero(predictions == 2))
+                if danger:
+                    log_event(f"{danger} DANGER predictions")
+            results.append(suite_row('end_to_end', window, batch, measure(end_to_end, repeats)))
+
+    journal.close()
+    durable.close()
+    scratch.cleanup()
+    return results
+
+def suite_metadata(model_path):
+    import sklearn
+    return {
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'sklearn': sklearn.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'model': model_path
+    }
+
+def compare_suites(baseline, current, tolerance):
+    # Rows are matched on (stage, window, batch); a regression is a best
+    # time more than `tolerance` slower than the baseline's.
+    previous = {(r['stage'], r['window'], r['batch']): r for r in baseline['results']}
+    regressions = []
+    for row in current['results']:
+        old = previous.get((row['stage'], row['window'], row['batch']))
+        if old and row['best_seconds'] > old['best_seconds'] * (1 + tolerance):
+            regressions.append({
+                'stage': row['stage'],
+                'window': row['window'],
+                'batch': row['batch'],
+                'baseline_seconds': old['best_seconds'],
+                'current_seconds': row['best_seconds'],
+                'slowdown': row['best_seconds'] / old['best_seconds']
+            })
+    return regressions
+
+# ----------------------------------------------------------------------
+# SECTION 6: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def run_batch(model, args):
+    results = bench_batch(model, args.batch_sizes, args.repeats)
+    for row in results:
+        print(f"batch={row['batch_size']:>7}  {row['seconds'] * 1000:9.3f} ms  "
+              f"{row['windows_per_second']:>12,.0f} windows/s")
+
+    best = results[-1]['windows_per_second']
+    status = "PASS" if best >= args.target else "FAIL"
+    print(f"{status}: {best:,.0f} windows/s (target {args.target:,.0f})")
+    return 0 if best >= args.target else 1
+
+def run_flat(model, args):
+    results = bench_flat(model, args.batch_sizes, args.repeats)
+    for row in results:
+        print(f"batch={row['batch_size']:>7}  sklearn {row['sklearn_seconds'] * 1000:9.3f} ms  "
+              f"flat {row['flat_seconds'] * 1000:9.3f} ms  x{row['speedup']:.1f}")
+    return 0
+
+def run_startup(model, args):
+    with tempfile.TemporaryDirectory() as scratch:
+        flat_path = FLAT_MODEL_PATH
+        if not is_flat_model(flat_path):
+            flat_path = os.path.join(scratch, 'model.flat')
+            save_flat_model(FlatForest.from_sklearn(model), flat_path)
+
+        paths = [('pickle', os.path.abspath(args.model)), ('flat-mmap', os.path.abspath(flat_path))]
+        results = bench_startup(paths, args.repeats)
+
+    for row in results:
+        print(f"{row['format']:>10}  load+first score {row['load_seconds'] * 1000:9.2f} ms  "
+              f"whole process {row['process_seconds'] * 1000:9.2f} ms")
+    return 0
+
+def run_home(model, args):
+    runs = bench_home(args.repeats)
+    for run in runs:
+        imported = {name: name in run['modules'] for name in HOME_HEAVY_MODULES}
+        print(f"Home run {run['run_seconds'] * 1000:9.2f} ms  whole process {run['process_seconds'] * 1000:9.2f} ms  "
+              + "  ".join(f"{name} {'imported' if loaded else 'not imported'}" for name, loaded in imported.items())
+              + ("  EXCEPTION" if run['exception'] else ""))
+    return 1 if any(run['exception'] for run in runs) else 0
+
+def run_suite(model, args):
+    report = {
+        'meta': suite_metadata(args.model),
+        'results': bench_suite(model, args.window_sizes, args.batch_sizes, args.repeats, args.max_samples)
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            report['regressions'] = compare_suites(json.load(f), report, args.tolerance)
+        status = 1 if report['regressions'] else 0
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+        for row in report['results']:
+            print(f"{row['stage']:>24}  window={row['window']:>5}  batch={row['batch']:>7}  "
+                  f"{row['best_seconds'] * 1000:10.3f} ms  {row['windows_per_second']:>14,.0f} windows/s")
+        for row in report.get('regressions', []):
+            print(f"REGRESSION {row['stage']} window={row['window']} batch={row['batch']}: x{row['slowdown']:.2f}")
+    else:
+        print(output)
+    return status
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--model', default=MODEL_PATH)
+    common.add_argument('--repeats', type=int, default=5)
+
+    parser = argparse.ArgumentParser(description="SWIRI inference benchmarks")
+    commands = parser.add_subparsers(dest='command')
+
+    batch = commands.add_parser('batch', parents=[common], help="Batch scoring throughput")
+    batch.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 1000, 10000, 100000])
+    batch.add_argument('--target', type=float, default=10000,
+                       help="Required windows/second for the largest batch")
+    batch.set_defaults(run=run_batch)
+
+    flat = commands.add_parser('flat', parents=[common], help="FlatForest vs sklearn predict_proba")
+    flat.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 10000])
+    flat.set_defaults(run=run_flat)
+
+    startup = commands.add_parser('startup', parents=[common], help="Cold start: pickle vs memory-mapped arrays")
+    startup.set_defaults(run=run_startup)
+
+    home = commands.add_parser('home', help="Cold Home-page run of the app in a fresh process")
+    home.add_argument('--repeats', type=int, default=3)
+    home.set_defaults(run=run_home)
+
+    suite = commands.add_parser('suite', parents=[common], help="Sensor -> feature -> model -> alert suite as JSON")
+    suite.add_argument('--window-sizes', type=int, nargs='+', default=SUITE_WINDOW_SIZES)
+    suite.add_argument('--batch-sizes', type=int, nargs='+', default=SUITE_BATCH_SIZES)
+    suite.add_argument('--max-samples', type=int, default=SUITE_MAX_SAMPLES)
+    suite.add_argument('--output', help="Write the JSON report here instead of stdout")
+    suite.add_argument('--baseline', help="Earlier JSON report to check for regressions")
+    suite.add_argument('--tolerance', type=float, default=0.25,
+                       help="Allowed slowdown vs the baseline before failing (0.25 = 25%%)")
+    suite.set_defaults(run=run_suite)
+
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in commands.choices:
+        argv = ['batch'] + argv
+    args = parser.parse_args(argv)
+
+    # The forest was fitted on a DataFrame; scoring raw arrays is intended.
+    warnings.filterwarnings('ignore', message='X does not have valid feature names')
+    # The home benchmark runs the app, which loads its own model (or not).
+    model = load_model_file(args.model) if 'model' in args else None
+    return args.run(model, args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
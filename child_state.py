@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from alerts import danger_probability
+from inference import LABELS, featurize, score_batch_proba
+from sensors import SCENARIOS, generate_windows
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: SHARED CHILD STATE
+# ----------------------------------------------------------------------
+
+# Fields kept per child; anything else passed to update() is ignored.
+CHILD_FIELDS = ['prediction', 'confidence', 'hr_mean', 'acc_mean', 'location', 'alert']
+
+class ChildStateStore:
+    """Thread-safe latest-state store keyed by child/device id.
+
+    Every update bumps a global version and moves the child to the end of
+    an ordered change log, so changes_since(version) walks back only over
+    the children updated after `version` and stops at the first older one.
+    A reader that remembers the version it last saw pays for the children
+    that changed, not for every child being monitored.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.states = {}
+        # child_id -> version of its latest update, oldest update first.
+        self.change_log = OrderedDict()
+        self.version = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def update(self, child_id, **fields):
+        with self.lock:
+            return self._update(child_id, fields, time.time_ns())
+
+    def update_many(self, child_ids, predictions, confidences, hr_mean=None, acc_mean=None, alert=None):
+        """Record one scored window per child, e.g. straight from score_batch."""
+        n = len(child_ids)
+        columns = [
+            np.asarray(predictions).tolist(),
+            np.asarray(confidences).tolist(),
+            [None] * n if hr_mean is None else np.asarray(hr_mean).tolist(),
+            [None] * n if acc_mean is None else np.asarray(acc_mean).tolist(),
+            [None] * n if alert is None else np.asarray(alert).tolist()
+        ]
+        now = time.time_ns()
+        with self.lock:
+            for child_id, prediction, confidence, hr, acc, active in zip(child_ids, *columns):
+                self._update(child_id, {
+                    'prediction': prediction,
+                    'confidence': confidence,
+                    'hr_mean': hr,
+                    'acc_mean': acc,
+                    'alert': active
+                }, now)
+            return self.version
+
+    def get(self, child_id):
+        with self.lock:
+            state = self.states.get(child_id)
+            return None if state is None else dict(state)
+
+    def changes_since(self, version):
+        """Return (current_version, [state, ...]) for children updated after `version`.
+
+        States come back oldest update first. Children removed since
+        `version` are not reported; use snapshot() to resynchronise.
+        """
+        with self.lock:
+            changed = []
+            for child_id in reversed(self.change_log):
+                if self.change_log[child_id] <= version:
+                    break
+                changed.append(dict(self.states[child_id]))
+            changed.reverse()
+            return self.version, changed
+
+    def snapshot(self):
+        return self.changes_since(0)
+
+    def _update(self, child_id, fields, now):
+        self.version += 1
+        state = self.states.get(child_id)
+        if state is None:
+            state = self.states[child_id] = {'child_id': child_id}
+        for name in CHILD_FIELDS:
+            if name in fields:
+                state[name] = fields[name]
+        state['updated_ns'] = now
+        state['version'] = self.version
+        self.change_log[child_id] = self.version
+        self.change_log.move_to_end(child_id)
+        return self.version
+
+# ----------------------------------------------------------------------
+# SECTION 2: PER-SESSION DASHBOARD VIEW
+# ----------------------------------------------------------------------
+
+class ChildStatusView:
+    """A session's mirror of the store, refreshed from changes only.
+
+    Label counts and the set of children in danger are adjusted per
+    changed child, so a refresh costs O(changed) whatever the fleet size.
+    A child is in danger while its smoothed alert is active, or, for
+    states recorded without one, when its latest window was DANGER.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.states = {}
+        self.label_counts = np.zeros(len(LABELS), dtype=np.int64)
+        self.danger = set()
+        self.changed = []
+
+    def refresh(self, store):
+        self.version, self.changed = store.changes_since(self.version)
+        for state in self.changed:
+            previous = self.states.get(state['child_id'])
+            if previous is not None:
+                self._count(previous, -1)
+            self.states[state['child_id']] = state
+            self._count(state, 1)
+        return self.changed
+
+    def _count(self, state, delta):
+        prediction = state.get('prediction')
+        if prediction in LABELS:
+            self.label_counts[prediction] += delta
+        alert = state.get('alert')
+        in_danger = prediction == SCENARIOS.index("DANGER") if alert is None else alert
+        if in_danger:
+            if delta > 0:
+                self.danger.add(state['child_id'])
+            else:
+                self.danger.discard(state['child_id'])
+
+# ----------------------------------------------------------------------
+# SECTION 3: SIMULATED FLEET
+# ----------------------------------------------------------------------
+
+def child_ids(n_children):
+    return [f"child-{i:04d}" for i in range(n_children)]
+
+def simulate_readings(store, model, ids, probabilities=None, rng=None, alerts=None):
+    """Generate, score and record one window for each child in `ids`.
+
+    With a DangerAlertFilter as `alerts`, each child's smoothed alert
+    state is recorded alongside its raw prediction.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    probabilities = np.full(len(SCENARIOS), 1.0 / len(SCENARIOS)) if probabilities is None else probabilities
+    codes = rng.choice(len(SCENARIOS), size=len(ids), p=probabilities)
+    heart_rate, accelerometer = generate_windows(codes, rng)
+    X = featurize(model, heart_rate, accelerometer)
+    predictions, confidences, class_probabilities = score_batch_proba(model, X)
+    alert = None
+    if alerts is not None:
+        alert, _ = alerts.update(ids, danger_probability(model, class_probabilities))
+    return store.update_many(ids, predictions, confidences, hr_mean=heart_rate.mean(axis=1),
+                             acc_mean=accelerometer.mean(axis=1), alert=alert)
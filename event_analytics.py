@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from events import DANGER, EVENT_TYPES, FEATURE_COLUMNS, NO_PREDICTION
+from features import FEATURE_ORDER
+from inference import LABELS
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: BUILDING COLUMNS
+# ----------------------------------------------------------------------
+
+HOUR_NS = 3600 * 10**9
+
+# Columns come from EventStore.columns(), or from columns_from_events()
+# for events replayed out of the journal. Every helper below is a single
+# vectorized pass over those arrays, with no per-event Python.
+
+def columns_from_events(events):
+    type_names = list(EVENT_TYPES)
+    ts_ns, type_code, prediction, confidence, features = [], [], [], [], []
+
+    for event in events:
+        if event['type'] not in type_names:
+            type_names.append(event['type'])
+        ts_ns.append(event['ts_ns'])
+        type_code.append(type_names.index(event['type']))
+        pred = event.get('prediction')
+        conf = event.get('confidence')
+        feats = event.get('features')
+        prediction.append(NO_PREDICTION if pred is None else pred)
+        confidence.append(np.nan if conf is None else conf)
+        features.append([np.nan] * FEATURE_COLUMNS if feats is None else feats)
+
+    return {
+        'ts_ns': np.asarray(ts_ns, dtype=np.int64),
+        'type_code': np.asarray(type_code, dtype=np.int8),
+        'prediction': np.asarray(prediction, dtype=np.int8),
+        'confidence': np.asarray(confidence, dtype=np.float32),
+        'features': np.asarray(features, dtype=np.float64).reshape(-1, FEATURE_COLUMNS),
+        'type_names': type_names
+    }
+
+def columns_from_journal(path, start_ns=None, end_ns=None):
+    from journal import read_range
+    return columns_from_events(read_range(path, start_ns, end_ns))
+
+# ----------------------------------------------------------------------
+# SECTION 2: AGGREGATIONS
+# ----------------------------------------------------------------------
+
+def type_mask(columns, event_type):
+    if event_type not in columns['type_names']:
+        return np.zeros(len(columns['ts_ns']), dtype=bool)
+    return columns['type_code'] == columns['type_names'].index(event_type)
+
+def danger_mask(columns):
+    return type_mask(columns, "AI_PROCESSING") & (columns['prediction'] == DANGER)
+
+def type_counts(columns):
+    counts = np.bincount(columns['type_code'], minlength=len(columns['type_names']))
+    return pd.Series(counts, index=columns['type_names'], name='events')
+
+def prediction_counts(columns):
+    predictions = columns['prediction'][type_mask(columns, "AI_PROCESSING")]
+    counts = np.bincount(predictions[predictions >= 0], minlength=len(LABELS))
+    return pd.Series(counts[:len(LABELS)], index=[LABELS[i] for i in range(len(LABELS))], name='predictions')
+
+def danger_alerts_per_hour(columns):
+    """Count of DANGER predictions per UTC hour, for hours that had any."""
+    hours = columns['ts_ns'][danger_mask(columns)] // HOUR_NS
+    buckets, counts = np.unique(hours, return_counts=True)
+    index = pd.to_datetime(buckets * HOUR_NS, unit='ns')
+    return pd.Series(counts, index=pd.Index(index, name='hour'), name='danger_alerts')
+
+def confidence_distribution(columns, bins=10):
+    """Histogram of model confidence (0-100 %) per predicted label."""
+    mask = type_mask(columns, "AI_PROCESSING") & ~np.isnan(columns['confidence'])
+    confidence = columns['confidence'][mask]
+    prediction = columns['prediction'][mask]
+    edges = np.linspace(0.0, 100.0, bins + 1)
+
+    # One 2-D histogram over (label, confidence) instead of a loop per label.
+    counts, _, _ = np.histogram2d(prediction, confidence,
+                                  bins=[np.arange(len(LABELS) + 1) - 0.5, edges])
+    index = pd.Index([f"{lo:.0f}-{hi:.0f}%" for lo, hi in zip(edges[:-1], edges[1:])], name='confidence')
+    return pd.DataFrame(counts.T.astype(np.int64), index=index, columns=[LABELS[i] for i in range(len(LABELS))])
+
+def feature_means_by_prediction(columns):
+    mask = type_mask(columns, "AI_PROCESSING") & (columns['prediction'] >= 0)
+    features = columns['features'][mask]
+    prediction = columns['prediction'][mask]
+    valid = ~np.isnan(features).any(axis=1)
+    features, prediction = features[valid], prediction[valid]
+
+    counts = np.bincount(prediction, minlength=len(LABELS))[:len(LABELS)]
+    totals = np.column_stack([
+        np.bincount(prediction, weights=features[:, i], minlength=len(LABELS))[:len(LABELS)]
+        for i in range(FEATURE_COLUMNS)
+    ])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = totals / counts[:, np.newaxis]
+    return pd.DataFrame(means, index=[LABELS[i] for i in range(len(LABELS))], columns=FEATURE_ORDER)
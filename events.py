@@ -0,0 +1,191 @@
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from itertools import islice
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: EVENT RECORDS
+# ----------------------------------------------------------------------
+
+EVENT_TYPES = ["SCENARIO", "AI_PROCESSING", "CAMERA", "CONFIRMATION"]
+
+# Label code for a DANGER prediction (see inference.LABELS).
+DANGER = 2
+
+# Placeholder for events that carry no model output.
+NO_PREDICTION = -1
+FEATURE_COLUMNS = 4
+
+def make_event(event_type, details, ts_ns=None, prediction=None, confidence=None, features=None):
+    ts_ns = time.time_ns() if ts_ns is None else ts_ns
+    event = {
+        'ts_ns': ts_ns,
+        'timestamp': format_timestamp(ts_ns),
+        'type': event_type,
+        'details': details
+    }
+    if prediction is not None:
+        event['prediction'] = int(prediction)
+        event['confidence'] = None if confidence is None else float(confidence)
+        event['features'] = None if features is None else [float(v) for v in features]
+    return event
+
+def format_timestamp(ts_ns):
+    return datetime.fromtimestamp(ts_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+
+def is_danger_event(event):
+    return event['type'] == "AI_PROCESSING" and event.get('prediction') == DANGER
+
+# ----------------------------------------------------------------------
+# SECTION 2: BOUNDED COLUMNAR EVENT STORE
+# ----------------------------------------------------------------------
+
+DEFAULT_CAPACITY = 10000
+
+class EventStore:
+    """Fixed-capacity event log with typed columns and O(1) statistics.
+
+    Events live in ring-buffer columns (int64 ts_ns, int8 type code, int8
+    prediction, float32 confidence, float64 features) addressed by a
+    running sequence number; once full, each append evicts the oldest
+    event. Per-type counters and a danger counter are adjusted on every
+    append and eviction, and a per-type deque of sequence numbers lets
+    pages walk one event type without scanning the others. columns()
+    hands the typed arrays to the vectorized helpers in event_analytics.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.type_names = list(EVENT_TYPES)
+        self.clear()
+
+    def clear(self):
+        self.ts_ns = np.zeros(self.capacity, dtype=np.int64)
+        self.type_code = np.zeros(self.capacity, dtype=np.int8)
+        self.prediction = np.full(self.capacity, NO_PREDICTION, dtype=np.int8)
+        self.confidence = np.full(self.capacity, np.nan, dtype=np.float32)
+        self.features = np.full((self.capacity, FEATURE_COLUMNS), np.nan)
+        self.details = [None] * self.capacity
+        self.first_seq = 0
+        self.next_seq = 0
+        self.by_type = defaultdict(deque)
+        self.type_counts = np.zeros(len(self.type_names), dtype=np.int64)
+        self.danger_count = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return self.next_seq - self.first_seq
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for seq in range(self.first_seq, self.next_seq):
+            yield self.event(seq)
+
+    def __reversed__(self):
+        for seq in range(self.next_seq - 1, self.first_seq - 1, -1):
+            yield self.event(seq)
+
+    def type_code_for(self, event_type):
+        if event_type not in self.type_names:
+            self.type_names.append(event_type)
+            self.type_counts = np.append(self.type_counts, 0)
+        return self.type_names.index(event_type)
+
+    def append(self, event):
+        if len(self) == self.capacity:
+            self._evict_oldest()
+
+        seq = self.next_seq
+        slot = seq % self.capacity
+        code = self.type_code_for(event['type'])
+        prediction = event.get('prediction')
+        confidence = event.get('confidence')
+        features = event.get('features')
+
+        self.ts_ns[slot] = event['ts_ns']
+        self.type_code[slot] = code
+        self.prediction[slot] = NO_PREDICTION if prediction is None else prediction
+        self.confidence[slot] = np.nan if confidence is None else confidence
+        self.features[slot] = np.nan if features is None else features
+        self.details[slot] = event['details']
+        self.next_seq += 1
+
+        self.by_type[code].append(seq)
+        self.type_counts[code] += 1
+        if is_danger_event(event):
+            self.danger_count += 1
+        return seq
+
+    def log(self, event_type, details, prediction=None, confidence=None, features=None):
+        event = make_event(event_type, details, prediction=prediction, confidence=confidence, features=features)
+        self.append(event)
+        return event
+
+    def count(self, event_type=None):
+        if event_type is None:
+            return len(self)
+        if event_type not in self.type_names:
+            return 0
+        return int(self.type_counts[self.type_names.index(event_type)])
+
+    def event(self, seq):
+        slot = seq % self.capacity
+        ts_ns = int(self.ts_ns[slot])
+        event = {
+            'ts_ns': ts_ns,
+            'timestamp': format_timestamp(ts_ns),
+            'type': self.type_names[self.type_code[slot]],
+            'details': self.details[slot]
+        }
+        if self.prediction[slot] != NO_PREDICTION:
+            event['prediction'] = int(self.prediction[slot])
+            event['confidence'] = None if np.isnan(self.confidence[slot]) else float(self.confidence[slot])
+            event['features'] = None if np.isnan(self.features[slot]).all() else self.features[slot].tolist()
+        return event
+
+    def latest(self, event_type=None, offset=0, limit=None):
+        """Newest-first events, optionally of one type, skipping `offset`."""
+        stop = None if limit is None else offset + limit
+        if event_type is None:
+            seqs = islice(range(self.next_seq - 1 - offset, self.first_seq - 1, -1), 0, limit)
+        elif event_type in self.type_names:
+            code = self.type_names.index(event_type)
+            seqs = islice(reversed(self.by_type.get(code, ())), offset, stop)
+        else:
+            seqs = ()
+        return [self.event(seq) for seq in seqs]
+
+    def columns(self):
+        """Typed columns of every stored event, oldest first."""
+        start = self.first_seq % self.capacity
+        order = (np.arange(len(self)) + start) % self.capacity
+        return {
+            'ts_ns': self.ts_ns[order],
+            'type_code': self.type_code[order],
+            'prediction': self.prediction[order],
+            'confidence': self.confidence[order],
+            'features': self.features[order],
+            'type_names': list(self.type_names)
+        }
+
+    def _evict_oldest(self):
+        seq = self.first_seq
+        slot = seq % self.capacity
+        code = self.type_code[slot]
+        danger = (self.type_names[code] == "AI_PROCESSING" and self.prediction[slot] == DANGER)
+        self.details[slot] = None
+        self.first_seq += 1
+        self.evicted += 1
+
+        # The oldest event overall is also the oldest of its own type.
+        self.by_type[code].popleft()
+        self.type_counts[code] -= 1
+        if danger:
+            self.danger_count -= 1
@@ -0,0 +1,291 @@
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: WINDOW FEATURES
+# ----------------------------------------------------------------------
+
+# 10 Hz sampling over a 5 second window.
+SAMPLE_RATE_HZ = 10
+WINDOW_SIZE = 50
+
+# Column order the RandomForest was trained on (HR_Mean, HR_Gradient,
+# Acc_Mean, Acc_Variance).
+FEATURE_ORDER = ['hr_mean', 'hr_gradient', 'acc_mean', 'acc_variance']
+
+def compute_features(hr_data, acc_data):
+    features = {
+        'hr_mean': np.mean(hr_data),
+        'hr_gradient': hr_data[-1] - hr_data[0],
+        'acc_mean': np.mean(acc_data),
+        'acc_variance': np.var(acc_data)
+    }
+    return features
+
+def compute_features_batch(hr_windows, acc_windows):
+    """compute_features over (N, W) arrays of windows, as an (N, 4) matrix.
+
+    Columns follow FEATURE_ORDER, ready for inference.score_batch.
+    """
+    return compute_feature_matrix(hr_windows, acc_windows, FEATURE_ORDER)
+
+# ----------------------------------------------------------------------
+# SECTION 2: FEATURE REGISTRY
+# ----------------------------------------------------------------------
+
+# name -> function(batch) returning one value per window of a
+# WindowBatch. Add features with @register_feature; a model picks the
+# ones it consumes by name (see model_features).
+FEATURE_REGISTRY = {}
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+def register_feature(name):
+    def decorator(func):
+        FEATURE_REGISTRY[name] = func
+        return func
+    return decorator
+
+class WindowBatch:
+    """(N, W) heart rate and accelerometer windows for one featurization pass.
+
+    Intermediates shared by several features (means, sorted windows, the
+    accelerometer spectrum) are computed on first use and then reused,
+    so a pass only pays for what the requested features need.
+    """
+
+    def __init__(self, hr_windows, acc_windows):
+        self.hr = np.asarray(hr_windows, dtype=np.float64)
+        self.acc = np.asarray(acc_windows, dtype=np.float64)
+        if self.hr.ndim != 2 or self.hr.shape != self.acc.shape or self.hr.shape[1] == 0:
+            raise ValueError(f"Expected matching non-empty (N, W) windows, got {self.hr.shape} and {self.acc.shape}")
+        self.cache = {}
+
+    def __len__(self):
+        return self.hr.shape[0]
+
+    def shared(self, key, compute):
+        if key not in self.cache:
+            self.cache[key] = compute()
+        return self.cache[key]
+
+    def mean(self, signal):
+        return self.shared(('mean', signal), lambda: getattr(self, signal).mean(axis=1))
+
+    def centered(self, signal):
+        return self.shared(('centered', signal), lambda: getattr(self, signal) - self.mean(signal)[:, np.newaxis])
+
+    def sorted(self, signal):
+        return self.shared(('sorted', signal), lambda: np.sort(getattr(self, signal), axis=1))
+
+    def power_spectrum(self, signal):
+        """One-sided power of the mean-removed window, DC bin dropped."""
+        def compute():
+            spectrum = np.fft.rfft(self.centered(signal), axis=1)[:, 1:]
+            return spectrum.real ** 2 + spectrum.imag ** 2
+        return self.shared(('power', signal), compute)
+
+def compute_feature_matrix(hr_windows, acc_windows, names):
+    """Compute only the registered features in `names`, as an (N, len(names)) matrix."""
+    unknown = [name for name in names if name not in FEATURE_REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown features: {', '.join(unknown)}")
+
+    batch = WindowBatch(hr_windows, acc_windows)
+    if not names:
+        return np.empty((len(batch), 0))
+    return np.column_stack([FEATURE_REGISTRY[name](batch) for name in names])
+
+def model_features(model):
+    """Feature names a model consumes, in the column order it expects.
+
+    A model declares them as `feature_names` (flat exports) or through
+    the `feature_names_in_` sklearn records when fitted on a DataFrame,
+    whose columns name registry features case-insensitively. Models that
+    declare nothing get FEATURE_ORDER.
+    """
+    names = getattr(model, 'feature_names', None)
+    if names is None and getattr(model, 'feature_names_in_', None) is not None:
+        names = [str(name).lower() for name in model.feature_names_in_]
+    return FEATURE_ORDER if names is None else list(names)
+
+@register_feature('hr_mean')
+def hr_mean(batch):
+    return batch.mean('hr')
+
+@register_feature('hr_gradient')
+def hr_gradient(batch):
+    return batch.hr[:, -1] - batch.hr[:, 0]
+
+@register_feature('acc_mean')
+def acc_mean(batch):
+    return batch.mean('acc')
+
+@register_feature('acc_variance')
+def acc_variance(batch):
+    return batch.acc.var(axis=1)
+
+@register_feature('hr_std')
+def hr_std(batch):
+    return batch.hr.std(axis=1)
+
+@register_feature('hr_slope')
+def hr_slope(batch):
+    """Least-squares HR trend in beats per minute per second."""
+    t = np.arange(batch.hr.shape[1]) / SAMPLE_RATE_HZ
+    t -= t.mean()
+    denominator = np.dot(t, t)
+    if denominator == 0.0:
+        return np.zeros(len(batch))
+    return batch.centered('hr') @ t / denominator
+
+def register_signal_features(signal):
+    @register_feature(f'{signal}_min')
+    def minimum(batch):
+        return batch.sorted(signal)[:, 0]
+
+    @register_feature(f'{signal}_max')
+    def maximum(batch):
+        return batch.sorted(signal)[:, -1]
+
+    @register_feature(f'{signal}_rms')
+    def rms(batch):
+        values = getattr(batch, signal)
+        return np.sqrt(np.einsum('ij,ij->i', values, values) / values.shape[1])
+
+    @register_feature(f'{signal}_zero_crossings')
+    def zero_crossings(batch):
+        """Crossings of the window mean, a cheap oscillation count."""
+        above = batch.centered(signal) > 0
+        return np.count_nonzero(above[:, 1:] != above[:, :-1], axis=1).astype(np.float64)
+
+    for q in PERCENTILES:
+        register_percentile(signal, q)
+
+def register_percentile(signal, q):
+    # Linear interpolation between order statistics, as np.percentile
+    # does, reading from the batch's shared sorted windows.
+    @register_feature(f'{signal}_p{q}')
+    def percentile(batch):
+        ordered = batch.sorted(signal)
+        position = q / 100 * (ordered.shape[1] - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, ordered.shape[1] - 1)
+        fraction = position - lower
+        return ordered[:, lower] + (ordered[:, upper] - ordered[:, lower]) * fraction
+
+register_signal_features('hr')
+register_signal_features('acc')
+
+@register_feature('acc_spectral_energy')
+def acc_spectral_energy(batch):
+    """Mean power per sample of the accelerometer's non-DC spectrum."""
+    return batch.power_spectrum('acc').sum(axis=1) / batch.acc.shape[1] ** 2
+
+@register_feature('acc_dominant_freq')
+def acc_dominant_freq(batch):
+    """Frequency (Hz) of the strongest non-DC accelerometer component."""
+    power = batch.power_spectrum('acc')
+    if power.shape[1] == 0:
+        return np.zeros(len(batch))
+    return (power.argmax(axis=1) + 1) * SAMPLE_RATE_HZ / batch.acc.shape[1]
+
+# ----------------------------------------------------------------------
+# SECTION 3: STREAMING FEATURES
+# ----------------------------------------------------------------------
+
+class StreamingFeatureExtractor:
+    """Sliding-window version of compute_features with O(1) updates.
+
+    Keeps the last `window` samples in ring buffers together with running
+    sums and sums of squares, so each new sample updates hr_mean,
+    hr_gradient, acc_mean and acc_variance without rescanning the window.
+    Accelerometer sums are taken around a shift near the window mean, so
+    the variance does not lose precision to a large offset.
+    """
+
+    def __init__(self, window=WINDOW_SIZE):
+        if window < 1:
+            raise ValueError("window must be at least 1 sample")
+        self.window = window
+        self.hr_buffer = np.zeros(window)
+        self.acc_buffer = np.zeros(window)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.head = 0
+        self.hr_sum = 0.0
+        self.acc_sum = 0.0
+        self.acc_sq_sum = 0.0
+        self.acc_shift = 0.0
+        self.updates_since_refresh = 0
+
+    @property
+    def ready(self):
+        return self.count == self.window
+
+    def update(self, hr, acc):
+        hr = float(hr)
+        acc = float(acc)
+
+        if self.count == 0:
+            self.acc_shift = acc
+        if self.count == self.window:
+            old_hr = self.hr_buffer[self.head]
+            old_acc = self.acc_buffer[self.head] - self.acc_shift
+            self.hr_sum -= old_hr
+            self.acc_sum -= old_acc
+            self.acc_sq_sum -= old_acc * old_acc
+        else:
+            self.count += 1
+
+        self.hr_buffer[self.head] = hr
+        self.acc_buffer[self.head] = acc
+        centred = acc - self.acc_shift
+        self.hr_sum += hr
+        self.acc_sum += centred
+        self.acc_sq_sum += centred * centred
+        self.head = (self.head + 1) % self.window
+
+        # Adding and subtracting floats forever lets rounding error creep
+        # into the sums; resumming once per full window keeps the cost
+        # amortised O(1) while holding the result to compute_features.
+        self.updates_since_refresh += 1
+        if self.updates_since_refresh >= self.window:
+            self._refresh_sums()
+
+        return self.features()
+
+    def extend(self, hr_data, acc_data):
+        if len(hr_data) != len(acc_data):
+            raise ValueError("hr_data and acc_data must have the same length")
+        features = None
+        for hr, acc in zip(hr_data, acc_data):
+            features = self.update(hr, acc)
+        return features
+
+    def features(self):
+        if self.count == 0:
+            return None
+
+        n = self.count
+        oldest = (self.head - n) % self.window
+        newest = (self.head - 1) % self.window
+        acc_offset = self.acc_sum / n
+        return {
+            'hr_mean': self.hr_sum / n,
+            'hr_gradient': self.hr_buffer[newest] - self.hr_buffer[oldest],
+            'acc_mean': self.acc_shift + acc_offset,
+            'acc_variance': max(self.acc_sq_sum / n - acc_offset * acc_offset, 0.0)
+        }
+
+    def _refresh_sums(self):
+        hr = self.hr_buffer[:self.count] if self.count < self.window else self.hr_buffer
+        acc = self.acc_buffer[:self.count] if self.count < self.window else self.acc_buffer
+        self.acc_shift = float(acc.mean())
+        centred = acc - self.acc_shift
+        self.hr_sum = float(hr.sum())
+        self.acc_sum = float(centred.sum())
+        self.acc_sq_sum = float(np.dot(centred, centred))
+        self.updates_since_refresh = 0
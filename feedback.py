@@ -0,0 +1,169 @@
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from events import DANGER
+from features import FEATURE_ORDER, WINDOW_SIZE
+from inference import LABELS
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: RECORD LAYOUT
+# ----------------------------------------------------------------------
+
+# Feedback is one binary file of fixed-size records (FEEDBACK_DTYPE)
+# beside a small JSON header. Appends are a single write() of one
+# record, a torn final record is dropped on open, and readers get
+# structured arrays straight from np.fromfile, so a million labelled
+# windows load without parsing any text.
+FEEDBACK_DIR = 'feedback'
+RECORDS_FILE = 'records.bin'
+META_FILE = 'meta.json'
+FEEDBACK_FORMAT_VERSION = 1
+
+# Parent verdicts, stored as int8 codes.
+PARENT_LABELS = ["CONFIRMED", "FALSE_ALARM"]
+CHILD_ID_BYTES = 32
+
+# 'label' is the training target derived from the verdict: DANGER when
+# confirmed, otherwise the model's most likely non-DANGER class. The raw
+# window is kept so retraining can use any registry feature, not only
+# the FEATURE_ORDER vector the app showed.
+FEEDBACK_DTYPE = np.dtype([
+    ('ts_ns', '<i8'),
+    ('child_id', f'S{CHILD_ID_BYTES}'),
+    ('parent_label', 'i1'),
+    ('label', 'i1'),
+    ('prediction', 'i1'),
+    ('confidence', '<f4'),
+    ('probabilities', '<f4', (len(LABELS),)),
+    ('features', '<f8', (len(FEATURE_ORDER),)),
+    ('heart_rate', '<f4', (WINDOW_SIZE,)),
+    ('accelerometer', '<f4', (WINDOW_SIZE,))
+])
+
+LABELS_INDEX = {name: code for code, name in LABELS.items()}
+
+def training_label(parent_label, probabilities=None):
+    if parent_label == "CONFIRMED":
+        return DANGER
+    if probabilities is None or not np.all(np.isfinite(probabilities)):
+        return LABELS_INDEX["NORMAL"]
+    ranked = np.argsort(probabilities)[::-1]
+    return int(next(label for label in ranked if label != DANGER))
+
+def window_column(values):
+    """Last WINDOW_SIZE samples, NaN-padded in front when fewer were recorded."""
+    column = np.full(WINDOW_SIZE, np.nan, dtype=np.float32)
+    values = np.asarray(values if values is not None else [], dtype=np.float32)[-WINDOW_SIZE:]
+    if len(values):
+        column[WINDOW_SIZE - len(values):] = values
+    return column
+
+# ----------------------------------------------------------------------
+# SECTION 2: FEEDBACK STORE
+# ----------------------------------------------------------------------
+
+class FeedbackStore:
+    """Append-only dataset of parent verdicts on DANGER alerts."""
+
+    def __init__(self, path=FEEDBACK_DIR):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        write_meta(path)
+        self.records_path = os.path.join(path, RECORDS_FILE)
+        self.lock = threading.Lock()
+        self.rows = recover(self.records_path)
+        self.file = open(self.records_path, 'ab')
+
+    def __len__(self):
+        return self.rows
+
+    def append(self, child_id, parent_label, heart_rate, accelerometer, features=None,
+               prediction=None, confidence=None, probabilities=None):
+        if parent_label not in PARENT_LABELS:
+            raise ValueError(f"parent_label must be one of {PARENT_LABELS}, got {parent_label!r}")
+
+        record = np.zeros(1, dtype=FEEDBACK_DTYPE)
+        record['ts_ns'] = time.time_ns()
+        record['child_id'] = str(child_id).encode()[:CHILD_ID_BYTES]
+        record['parent_label'] = PARENT_LABELS.index(parent_label)
+        record['prediction'] = -1 if prediction is None else prediction
+        record['confidence'] = np.nan if confidence is None else confidence
+        record['probabilities'] = np.nan if probabilities is None else probabilities
+        record['label'] = training_label(parent_label, None if probabilities is None else np.asarray(probabilities))
+        record['features'] = [np.nan if features is None else features.get(name, np.nan) for name in FEATURE_ORDER]
+        record['heart_rate'] = window_column(heart_rate)
+        record['accelerometer'] = window_column(accelerometer)
+
+        with self.lock:
+            self.file.write(record.tobytes())
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.rows += 1
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def write_meta(path):
+    meta_path = os.path.join(path, META_FILE)
+    meta = {
+        'format_version': FEEDBACK_FORMAT_VERSION,
+        'window': WINDOW_SIZE,
+        'features': FEATURE_ORDER,
+        'labels': [LABELS[i] for i in range(len(LABELS))],
+        'parent_labels': PARENT_LABELS
+    }
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            existing = json.load(f)
+        if existing != meta:
+            raise ValueError(f"Feedback in {path} was written with a different layout: {existing}")
+        return
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+def recover(records_path):
+    """Drop a torn final record; return the number of whole records."""
+    if not os.path.exists(records_path):
+        return 0
+    size = os.path.getsize(records_path)
+    whole = size - size % FEEDBACK_DTYPE.itemsize
+    if whole != size:
+        with open(records_path, 'rb+') as f:
+            f.truncate(whole)
+    return whole // FEEDBACK_DTYPE.itemsize
+
+# ----------------------------------------------------------------------
+# SECTION 3: READER
+# ----------------------------------------------------------------------
+
+CHUNK_RECORDS = 100000
+
+def feedback_rows(path=FEEDBACK_DIR):
+    records_path = os.path.join(path, RECORDS_FILE)
+    if not os.path.exists(records_path):
+        return 0
+    return os.path.getsize(records_path) // FEEDBACK_DTYPE.itemsize
+
+def iter_feedback(path=FEEDBACK_DIR, chunk_records=CHUNK_RECORDS):
+    """Yield whole records as structured arrays of at most `chunk_records` rows.
+
+    Plain reads rather than a memory map, so pages already consumed do
+    not stay resident while a large dataset streams through.
+    """
+    rows = feedback_rows(path)
+    if rows == 0:
+        return
+    with open(os.path.join(path, RECORDS_FILE), 'rb') as f:
+        for start in range(0, rows, chunk_records):
+            yield np.fromfile(f, dtype=FEEDBACK_DTYPE, count=min(chunk_records, rows - start))
+
+def load_feedback(path=FEEDBACK_DIR):
+    """Every whole record in one array; use iter_feedback for large datasets."""
+    chunks = list(iter_feedback(path))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=FEEDBACK_DTYPE)
@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+
+import numpy as np
+
+from features import model_features
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: FLATTENED FOREST
+# ----------------------------------------------------------------------
+
+# Rows are walked through the trees in blocks of this size so the
+# (n_trees, block) index arrays stay cache-sized on large batches.
+BLOCK_SIZE = 2048
+
+class FlatForest:
+    """A RandomForestClassifier compiled into contiguous NumPy arrays.
+
+    Every tree's nodes are concatenated into shared feature, threshold,
+    left/right child and leaf value arrays; `roots` holds each tree's
+    first node. Leaves point back at themselves with an infinite
+    threshold, so all trees can be stepped together for a fixed number
+    of levels. Exposes `classes_`, `predict` and `predict_proba`, which
+    makes it a drop-in for the sklearn model in inference.score_batch.
+    Inputs are expected to be finite, as compute_features always is.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, depth, classes, children=None,
+                 feature_names=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.depth = int(depth)
+        self.classes_ = classes
+        # Registry names of the input columns (see features.model_features);
+        # None for exports that predate them, which use FEATURE_ORDER.
+        self.feature_names = None if feature_names is None else list(feature_names)
+        if self.feature_names is not None:
+            self.n_features_in_ = len(self.feature_names)
+        else:
+            self.n_features_in_ = int(feature.max()) + 1 if len(feature) else 0
+        # Children interleaved as (right, left) so a node's next hop is
+        # children[2 * node + went_left].
+        self.children = np.column_stack([right, left]).ravel() if children is None else children
+
+    @classmethod
+    def from_sklearn(cls, model):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        depth = 0
+        offset = 0
+
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            n = tree.node_count
+            is_leaf = tree.children_left == -1
+            nodes = np.arange(n)
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+
+            # scikit-learn >= 1.4 stores leaf class fractions and returns
+            # them untouched; older pickles hold raw counts that
+            # predict_proba normalised per leaf.
+            value = tree.value[:, 0, :len(model.classes_)].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            if not np.allclose(normalizer[normalizer != 0.0], 1.0):
+                normalizer[normalizer == 0.0] = 1.0
+                value = value / normalizer
+            values.append(value)
+
+            roots.append(offset)
+            depth = max(depth, tree.max_depth)
+            offset += n
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            depth=depth,
+            classes=np.asarray(model.classes_),
+            feature_names=model_features(model)
+        )
+
+    @property
+    def n_estimators(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """Return the (n_trees, N) leaf index reached by every row in every tree."""
+        # sklearn compares float32 inputs against float64 thresholds;
+        # doing the same keeps every split decision identical.
+        X = np.asarray(X, dtype=np.float32)
+        n = X.shape[0]
+        columns = np.ascontiguousarray(X.T).ravel()
+        rows = np.arange(n)
+        nodes = np.repeat(self.roots[:, np.newaxis], n, axis=1)
+        for _ in range(self.depth):
+            go_left = columns.take(self.feature.take(nodes) * n + rows) <= self.threshold.take(nodes)
+            nodes = self.children.take(nodes * 2 + go_left)
+        return nodes
+
+    def predict_proba(self, X):
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        proba = np.empty((X.shape[0], len(self.classes_)))
+        for start in range(0, X.shape[0], BLOCK_SIZE):
+            leaves = self.apply(X[start:start + BLOCK_SIZE])
+            # Reducing over the tree axis adds trees one after another in
+            # estimator order, matching sklearn's accumulation bit for bit.
+            proba[start:start + BLOCK_SIZE] = self.value.take(leaves, axis=0).sum(axis=0)
+        proba /= self.n_estimators
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(self.predict_proba(X).argmax(axis=1))
+
+# ----------------------------------------------------------------------
+# SECTION 2: ON-DISK ARTIFACT
+# ----------------------------------------------------------------------
+
+# A flat model is a directory of plain .npy files plus a small JSON
+# header. np.load(mmap_mode='r') maps them straight from the page cache,
+# so replicas on one host share the same physical pages and loading
+# needs neither unpickling nor importing scikit-learn.
+FLAT_ARRAYS = ['feature', 'threshold', 'left', 'right', 'children', 'value', 'roots', 'classes']
+FLAT_FORMAT_VERSION = 1
+
+def save_flat_model(flat, path):
+    os.makedirs(path, exist_ok=True)
+    for name in FLAT_ARRAYS:
+        array = flat.classes_ if name == 'classes' else getattr(flat, name)
+        np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump({'format_version': FLAT_FORMAT_VERSION, 'depth': flat.depth,
+                   'features': flat.feature_names}, f)
+
+def load_flat_model(path, mmap=True):
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    if meta.get('format_version') != FLAT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported flat model format in {path}: {meta.get('format_version')}")
+
+    mmap_mode = 'r' if mmap else None
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in FLAT_ARRAYS
+    }
+    # classes_ is tiny and is handed back to callers as labels, so keep
+    # it as a regular in-memory array.
+    classes = np.array(arrays.pop('classes'))
+    return FlatForest(depth=meta['depth'], classes=classes, feature_names=meta.get('features'), **arrays)
+
+def is_flat_model(path):
+    return os.path.isfile(os.path.join(path, 'meta.json'))
+
+# ----------------------------------------------------------------------
+# SECTION 3: EXPORT ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    if len(sys.argv) != 3:
+        print("usage: python flat_forest.py <model.pkl> <output_dir>")
+        return 2
+
+    import joblib
+    model = joblib.load(sys.argv[1])
+    save_flat_model(FlatForest.from_sklearn(model), sys.argv[2])
+    print(f"Exported {len(model.estimators_)} trees to {sys.argv[2]}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
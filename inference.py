@@ -0,0 +1,135 @@
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+from features import compute_feature_matrix, model_features
+from flat_forest import is_flat_model, load_flat_model
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: MODEL ARTIFACT
+# ----------------------------------------------------------------------
+
+MODEL_PATH = 'swiri_rf_model.pkl'
+
+# Memory-mapped export of MODEL_PATH; see flat_forest.py.
+FLAT_MODEL_PATH = 'swiri_rf_model.flat'
+
+LABELS = {0: "NORMAL", 1: "PLAYING", 2: "DANGER"}
+
+def load_model_file(path=MODEL_PATH):
+    if is_flat_model(path):
+        return load_flat_model(path)
+
+    # Deferred so processes serving the flat artifact never pay for
+    # importing joblib and scikit-learn.
+    import joblib
+    return joblib.load(path)
+
+def default_model_path():
+    return FLAT_MODEL_PATH if is_flat_model(FLAT_MODEL_PATH) else MODEL_PATH
+
+def get_prediction_label(pred):
+    return LABELS.get(pred, "UNKNOWN")
+
+# ----------------------------------------------------------------------
+# SECTION 2: BATCH SCORING
+# ----------------------------------------------------------------------
+
+def featurize(model, hr_windows, acc_windows):
+    """(N, W) raw windows -> the feature matrix `model` consumes."""
+    return compute_feature_matrix(hr_windows, acc_windows, model_features(model))
+
+def score_batch(model, X):
+    """Score an (N, n_features) matrix, as built by featurize, in one vectorized call.
+
+    Returns (predictions, confidences), where confidences are the winning
+    class probability in percent, as shown on the AI Engine page.
+    """
+    predictions, confidences, _ = score_batch_proba(model, X)
+    return predictions, confidences
+
+def score_batch_proba(model, X):
+    """score_batch that also returns the (N, n_classes) probabilities."""
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    n_features = len(model_features(model))
+    if X.ndim != 2 or X.shape[1] != n_features:
+        raise ValueError(f"Expected an (N, {n_features}) feature matrix, got shape {X.shape}")
+
+    probabilities = model.predict_proba(X)
+    best = probabilities.argmax(axis=1)
+    predictions = model.classes_.take(best)
+    confidences = probabilities[np.arange(len(best)), best] * 100
+    return predictions, confidences, probabilities
+
+def score_children(model, child_ids, X):
+    predictions, confidences = score_batch(model, X)
+    if len(child_ids) != len(predictions):
+        raise ValueError(f"Got {len(child_ids)} child ids for {len(predictions)} windows")
+
+    return {
+        child_id: {'prediction': int(pred), 'confidence': float(conf)}
+        for child_id, pred, conf in zip(child_ids, predictions, confidences)
+    }
+
+# ----------------------------------------------------------------------
+# SECTION 3: SINGLE-WINDOW SCORING
+# ----------------------------------------------------------------------
+
+def run_pipeline(model, hr_data, acc_data, tracker=None):
+    """Feature extraction + inference for one window, timed with perf_counter;
+    the single-window entry point used by the app pages.
+
+    Returns (features, prediction, confidence, probabilities, timings) where
+    features maps each feature the model consumes to its value,
+    probabilities is the window's row of predict_proba and timings holds
+    features_ms, model_ms and total_ms for this call.
+    """
+    start = time.perf_counter()
+    names = model_features(model)
+    X = compute_feature_matrix([hr_data], [acc_data], names)
+    featured = time.perf_counter()
+    predictions, confidences, probabilities = score_batch_proba(model, X)
+    finished = time.perf_counter()
+
+    features = dict(zip(names, X[0].tolist()))
+    prediction, confidence = int(predictions[0]), float(confidences[0])
+
+    timings = {
+        'features_ms': (featured - start) * 1000,
+        'model_ms': (finished - featured) * 1000,
+        'total_ms': (finished - start) * 1000
+    }
+    if tracker is not None:
+        tracker.record(timings['total_ms'])
+    return features, prediction, confidence, probabilities[0], timings
+
+# ----------------------------------------------------------------------
+# SECTION 4: LATENCY MEASUREMENT
+# ----------------------------------------------------------------------
+
+class LatencyTracker:
+    """Rolling window of per-call latencies (ms) with percentile summaries."""
+
+    def __init__(self, capacity=1000):
+        self.samples = deque(maxlen=capacity)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.samples)
+
+    def record(self, latency_ms):
+        with self.lock:
+            self.samples.append(latency_ms)
+
+    def percentiles(self, quantiles=(50, 95, 99)):
+        with self.lock:
+            samples = np.fromiter(self.samples, dtype=np.float64, count=len(self.samples))
+        if len(samples) == 0:
+            return None
+        values = np.percentile(samples, quantiles)
+        return {f"p{q}": float(v) for q, v in zip(quantiles, values)}
@@ -0,0 +1,267 @@
+import argparse
+import heapq
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+from datetime import datetime
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: FILE LAYOUT
+# ----------------------------------------------------------------------
+
+# A journal file is JSON lines, one event per line, with a
+# non-decreasing 'ts_ns'. Beside it, <path>.idx holds a sparse index of
+# little-endian (ts_ns, byte offset) int64 pairs written every
+# INDEX_EVERY records, used to seek near the start of a time range.
+#
+# Offsets, the index and the timestamp order are tracked by the one
+# process writing a file, so replicas never share a file: each writes
+# its own events-<host>-<pid>.jsonl in JOURNAL_DIR, and read_range on
+# the directory merges them by time.
+JOURNAL_DIR = 'journal'
+JOURNAL_SUFFIX = '.jsonl'
+INDEX_SUFFIX = '.idx'
+INDEX_EVERY = 64
+INDEX_ENTRY = struct.Struct('<qq')
+
+# Group commit: pending events are written and fsync'd together once
+# FLUSH_INTERVAL seconds pass or MAX_BATCH events are waiting.
+FLUSH_INTERVAL = 0.2
+MAX_BATCH = 512
+
+def journal_path(directory=JOURNAL_DIR):
+    """This process's own journal file in `directory`."""
+    host = ''.join(c if c.isalnum() or c in '-_' else '_' for c in socket.gethostname())
+    return os.path.join(directory, f"events-{host}-{os.getpid()}{JOURNAL_SUFFIX}")
+
+def journal_files(path):
+    """The journal files under `path`: itself if a file, else every one in the directory."""
+    if not os.path.isdir(path):
+        return [path] if os.path.exists(path) else []
+    return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(JOURNAL_SUFFIX))
+
+def index_path(path):
+    return path + INDEX_SUFFIX
+
+def recover(path):
+    """Drop a torn final line and index entries past the end of the data."""
+    if not os.path.exists(path):
+        return 0
+
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            tail = max(0, size - 65536)
+            f.seek(tail)
+            chunk = f.read()
+            if not chunk.endswith(b'\n'):
+                last_newline = chunk.rfind(b'\n')
+                # A single record longer than the chunk is not expected;
+                # fall back to truncating the whole file in that case.
+                size = tail + last_newline + 1 if last_newline >= 0 else 0
+                f.truncate(size)
+
+    idx = index_path(path)
+    if os.path.exists(idx):
+        entries = load_index(path)
+        valid = entries[entries[:, 1] < size] if len(entries) else entries
+        if len(valid) != len(entries):
+            with open(idx, 'wb') as f:
+                f.write(valid.astype('<i8').tobytes())
+    return size
+
+def load_index(path):
+    idx = index_path(path)
+    if not os.path.exists(idx):
+        return np.empty((0, 2), dtype=np.int64)
+    raw = np.fromfile(idx, dtype='<i8')
+    return raw[:len(raw) - len(raw) % 2].reshape(-1, 2)
+
+# ----------------------------------------------------------------------
+# SECTION 2: WRITER
+# ----------------------------------------------------------------------
+
+class EventJournal:
+    """Append-only, durable event journal with batched fsync.
+
+    append() only queues the encoded line; a background thread writes
+    every queued line in one write() and one fsync() per batch, so a
+    burst of events shares a single disk flush. flush() forces the
+    current batch to disk before returning. Only one process may write
+    a given file (see journal_path).
+    """
+
+    def __init__(self, path, flush_interval=FLUSH_INTERVAL, max_batch=MAX_BATCH,
+                 index_every=INDEX_EVERY, fsync=True):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.index_every = index_every
+        self.fsync = fsync
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.offset = recover(path)
+        self.last_ts = self._last_timestamp()
+        self.records = 0
+        self.batches = 0
+
+        self.file = open(path, 'ab')
+        self.index_file = open(index_path(path), 'ab')
+        self.pending = []
+        self.closed = False
+        self.cond = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name='event-journal', daemon=True)
+        self.thread.start()
+
+    def append(self, event):
+        with self.cond:
+            if self.closed:
+                raise ValueError("Journal is closed")
+            # Keep timestamps non-decreasing in file order, even if the
+            # wall clock steps back, so range reads can stop early.
+            ts = max(int(event['ts_ns']), self.last_ts)
+            self.last_ts = ts
+            if ts != event['ts_ns']:
+                event = dict(event, ts_ns=ts)
+            line = (json.dumps(event, separators=(',', ':'), default=str) + '\n').encode()
+            self.pending.append((ts, line))
+            if len(self.pending) >= self.max_batch:
+                self.cond.notify()
+
+    def flush(self):
+        with self.write_lock:
+            with self.cond:
+                batch, self.pending = self.pending, []
+            self._write(batch)
+
+    def close(self):
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            self.cond.notify()
+        self.thread.join()
+        self.flush()
+        self.file.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.closed or len(self.pending) >= self.max_batch,
+                                   timeout=self.flush_interval)
+                closing = self.closed
+            self.flush()
+            if closing:
+                return
+
+    def _write(self, batch):
+        if not batch:
+            return
+
+        index = []
+        for ts, line in batch:
+            if self.records % self.index_every == 0:
+                index.append(INDEX_ENTRY.pack(ts, self.offset))
+            self.offset += len(line)
+            self.records += 1
+
+        self.file.write(b''.join(line for _, line in batch))
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+        self.batches += 1
+
+        # The index is only a hint for seeking (and is repaired on open),
+        # so it is flushed but not fsync'd.
+        if index:
+            self.index_file.write(b''.join(index))
+            self.index_file.flush()
+
+    def _last_timestamp(self):
+        if self.offset == 0:
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, self.offset - 65536))
+            lines = f.read().splitlines()
+        return int(json.loads(lines[-1])['ts_ns']) if lines else 0
+
+# ----------------------------------------------------------------------
+# SECTION 3: RANGE READER
+# ----------------------------------------------------------------------
+
+def read_range(path, start_ns=None, end_ns=None):
+    """Yield journal events with start_ns <= ts_ns <= end_ns, oldest first.
+
+    `path` is one journal file or a directory of them, whose files are
+    merged by ts_ns. Each file is read from its last sparse index entry
+    before start_ns, so only about INDEX_EVERY records ahead of the range
+    are read and skipped.
+    """
+    files = journal_files(path)
+    if len(files) == 1:
+        yield from read_file_range(files[0], start_ns, end_ns)
+    elif files:
+        yield from heapq.merge(*(read_file_range(file, start_ns, end_ns) for file in files),
+                               key=lambda event: event['ts_ns'])
+
+def read_file_range(path, start_ns=None, end_ns=None):
+    offset = 0
+    if start_ns is not None:
+        entries = load_index(path)
+        # Every record before the last entry stamped strictly earlier than
+        # start_ns is itself earlier, so reading can begin there.
+        position = np.searchsorted(entries[:, 0], start_ns, side='left') - 1
+        if position >= 0:
+            offset = int(entries[position, 1])
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            event = json.loads(line)
+            ts = event['ts_ns']
+            if start_ns is not None and ts < start_ns:
+                continue
+            if end_ns is not None and ts > end_ns:
+                break
+            yield event
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def parse_time(value):
+    return None if value is None else int(datetime.fromisoformat(value).timestamp() * 1e9)
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a time range from the SWIRI event journal")
+    parser.add_argument('path', nargs='?', default=JOURNAL_DIR, help="Journal file or directory of journals")
+    parser.add_argument('--start', help="ISO time, e.g. 2024-05-01T08:00:00")
+    parser.add_argument('--end', help="ISO time, inclusive")
+    parser.add_argument('--type', help="Only replay events of this type")
+    args = parser.parse_args()
+
+    for event in read_range(args.path, parse_time(args.start), parse_time(args.end)):
+        if args.type is None or event['type'] == args.type:
+            sys.stdout.write(json.dumps(event) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,400 @@
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+from inference import LatencyTracker
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: NOTIFICATIONS
+# ----------------------------------------------------------------------
+
+# Who hears about each kind of notification: contact roles, resolved
+# per child, so each (child_id, role) pair is one recipient.
+RECIPIENTS = {
+    'DANGER': ['parent', 'school', 'emergency_contacts'],
+    'CONFIRMED': ['school', 'emergency_contacts'],
+    'FALSE_ALARM': ['parent', 'school']
+}
+
+# A DANGER notification for a child already notified within this many
+# seconds is dropped; any other notification for the child re-arms it.
+DEDUP_SECONDS = 300
+
+def make_notification(child_id, kind, message, recipients=None):
+    if recipients is None and kind not in RECIPIENTS:
+        raise ValueError(f"Unknown notification kind {kind!r}; pass recipients explicitly")
+    return {
+        'child_id': child_id,
+        'kind': kind,
+        'message': message,
+        'recipients': list(RECIPIENTS[kind] if recipients is None else recipients),
+        'created_ns': time.time_ns()
+    }
+
+# ----------------------------------------------------------------------
+# SECTION 2: SINKS
+# ----------------------------------------------------------------------
+
+class LocalSink:
+    """Stand-in for the SMS / push / e-mail gateway.
+
+    Records every delivered batch in memory, and can add a per-batch
+    delay and fail a fraction of sends so retries get exercised.
+    """
+
+    def __init__(self, delay=0.0, failure_rate=0.0, capacity=10000, seed=None):
+        self.delay = delay
+        self.failure_rate = failure_rate
+        self.delivered = deque(maxlen=capacity)
+        self.rng = random.Random(seed)
+
+    async def send(self, recipient, batch):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            raise ConnectionError(f"Simulated delivery failure to {recipient}")
+        self.delivered.append((recipient, batch))
+
+# ----------------------------------------------------------------------
+# SECTION 3: DISPATCHER
+# ----------------------------------------------------------------------
+
+QUEUE_SIZE = 10000
+RECIPIENT_QUEUE_SIZE = 100
+MAX_SENDERS = 1000
+BATCH_SIZE = 100
+BATCH_DELAY = 0.05
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 0.1
+BACKOFF_CAP_SECONDS = 5.0
+
+class NotificationDispatcher:
+    """Bounded, batched, retrying fan-out of notifications to a sink.
+
+    submit() never blocks: it deduplicates, then puts the notification
+    on a bounded queue or counts it as dropped when the queue is full. A
+    router copies each one onto a bounded queue per recipient, a
+    (child_id, role) contact, and one sender per recipient takes up to
+    `batch_size` notifications (waiting at most `batch_delay` for a
+    batch to fill) and delivers them in one sink call, retrying with
+    exponential backoff and jitter. At most `max_senders` senders exist
+    at once: a new recipient retires the least recently used idle one,
+    or waits for one to go idle. Queue latency is measured from submit()
+    to delivery.
+    """
+
+    def __init__(self, sink, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE, batch_delay=BATCH_DELAY,
+                 max_attempts=MAX_ATTEMPTS, backoff=BACKOFF_SECONDS, backoff_cap=BACKOFF_CAP_SECONDS,
+                 dedup_seconds=DEDUP_SECONDS, max_senders=MAX_SENDERS, recipient_queue_size=RECIPIENT_QUEUE_SIZE):
+        self.sink = sink
+        self.queue_size = queue_size
+        self.recipient_queue_size = recipient_queue_size
+        self.max_senders = max_senders
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_cap = backoff_cap
+        self.dedup_seconds = dedup_seconds
+
+        self.queue = None
+        # recipient -> (queue, sender task), least recently used first.
+        self.senders = OrderedDict()
+        # Recipients whose sender holds a batch it has not finished with.
+        self.sending = set()
+        self.sender_idle = None
+        self.tasks = []
+        # child_id -> monotonic time of its last DANGER notification,
+        # oldest first so expired entries are pruned from the front.
+        self.recent_danger = OrderedDict()
+        self.dead_letters = deque(maxlen=1000)
+        self.latency = LatencyTracker()
+        self.counts = dict.fromkeys(
+            ['submitted', 'deduplicated', 'dropped', 'delivered', 'batches', 'retries', 'failed', 'senders_retired'], 0)
+        self.started = None
+        self.loop = None
+        self.thread = None
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(self.queue_size)
+        self.sender_idle = asyncio.Event()
+        self.started = time.perf_counter()
+        self.tasks.append(asyncio.create_task(self._route()))
+
+    def submit(self, notification):
+        """Queue a notification from the event loop; False if deduplicated or dropped."""
+        if self._is_duplicate(notification):
+            self.counts['deduplicated'] += 1
+            return False
+        try:
+            self.queue.put_nowait((time.perf_counter(), notification))
+        except asyncio.QueueFull:
+            self.counts['dropped'] += 1
+            return False
+        # Only a DANGER that is actually on its way suppresses repeats; a
+        # dropped one must not stop the next attempt.
+        if notification['kind'] == 'DANGER':
+            self.recent_danger[notification['child_id']] = time.monotonic()
+        self.counts['submitted'] += 1
+        return True
+
+    def submit_threadsafe(self, notification):
+        """submit() from another thread, e.g. a Streamlit script run; returns at once."""
+        self.loop.call_soon_threadsafe(self.submit, notification)
+
+    async def join(self):
+        """Wait until everything queued so far has been delivered or given up on."""
+        await self.queue.join()
+        for queue, _ in list(self.senders.values()):
+            await queue.join()
+
+    async def close(self):
+        await self.join()
+        tasks = self.tasks + [task for _, task in self.senders.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks = []
+        self.senders.clear()
+
+    def metrics(self):
+        elapsed = time.perf_counter() - self.started if self.started is not None else 0.0
+        return {
+            **self.counts,
+            'queued': (self.queue.qsize() if self.queue is not None else 0)
+                      + sum(queue.qsize() for queue, _ in list(self.senders.values())),
+            'senders': len(self.senders),
+            'deliveries_per_second': self.counts['delivered'] / elapsed if elapsed > 0 else 0.0,
+            'queue_latency_ms': self.latency.percentiles()
+        }
+
+    def start_thread(self):
+        """Run the dispatcher on its own event loop in a daemon thread."""
+        ready = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+
+        self.thread = threading.Thread(target=run, name="notification-dispatcher", daemon=True)
+        self.thread.start()
+        ready.wait()
+        return self
+
+    def stop_thread(self, timeout=5.0):
+        """Flush what is queued, then stop the background loop."""
+        if self.thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop).result(timeout)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        self.thread = None
+
+    def _is_duplicate(self, notification):
+        child_id = notification['child_id']
+        if notification['kind'] != 'DANGER':
+            self.recent_danger.pop(child_id, None)
+            return False
+
+        now = time.monotonic()
+        while self.recent_danger:
+            oldest, seen = next(iter(self.recent_danger.items()))
+            if now - seen < self.dedup_seconds:
+                break
+            del self.recent_danger[oldest]
+        return child_id in self.recent_danger
+
+    async def _route(self):
+        while True:
+            queued_at, notification = await self.queue.get()
+            try:
+                for role in notification['recipients']:
+                    queue = await self._recipient_queue((notification['child_id'], role))
+                    await queue.put((queued_at, notification))
+            finally:
+                self.queue.task_done()
+
+    async def _recipient_queue(self, recipient):
+        sender = self.senders.get(recipient)
+        if sender is not None:
+            self.senders.move_to_end(recipient)
+            return sender[0]
+
+        while len(self.senders) >= self.max_senders:
+            idle = next((other for other, (queue, _) in self.senders.items()
+                         if queue.empty() and other not in self.sending), None)
+            if idle is None:
+                # Every sender is mid-batch; wait for one to finish.
+                self.sender_idle.clear()
+                await self.sender_idle.wait()
+                continue
+            _, task = self.senders.pop(idle)
+            task.cancel()
+            self.counts['senders_retired'] += 1
+
+        queue = asyncio.Queue(self.recipient_queue_size)
+        self.senders[recipient] = (queue, asyncio.create_task(self._send_loop(recipient, queue)))
+        return queue
+
+    async def _send_loop(self, recipient, queue):
+        while True:
+            batch = [await queue.get()]
+            self.sending.add(recipient)
+            deadline = time.perf_counter() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._deliver(recipient, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+                self.sending.discard(recipient)
+                if queue.empty():
+                    self.sender_idle.set()
+
+    async def _deliver(self, recipient, batch):
+        notifications = [notification for _, notification in batch]
+        for attempt in range(self.max_attempts):
+            try:
+                await self.sink.send(recipient, notifications)
+            except Exception as e:
+                if attempt + 1 == self.max_attempts:
+                    self.counts['failed'] += len(batch)
+                    self.dead_letters.append((recipient, notifications, repr(e)))
+                    # A DANGER that reached no-one must not suppress the
+                    # next one for the same child.
+                    for notification in notifications:
+                        if notification['kind'] == 'DANGER':
+                            self.recent_danger.pop(notification['child_id'], None)
+                    return
+                self.counts['retries'] += 1
+                delay = min(self.backoff_cap, self.backoff * 2 ** attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            else:
+                break
+
+        delivered = time.perf_counter()
+        for queued_at, _ in batch:
+            self.latency.record((delivered - queued_at) * 1000)
+        self.counts['delivered'] += len(batch)
+        self.counts['batches'] += 1
+
+# ----------------------------------------------------------------------
+# SECTION 4: LOAD TEST ENTRY POINT
+# ----------------------------------------------------------------------
+
+async def load_test(args):
+    sink = LocalSink(delay=args.sink_delay, failure_rate=args.failure_rate, seed=0)
+    dispatcher = NotificationDispatcher(sink, queue_size=args.queue_size, batch_size=args.batch_size,
+                                        backoff=args.backoff)
+    await dispatcher.start()
+    rng = random.Random(0)
+    other_kinds = [kind for kind in RECIPIENTS if kind != 'DANGER']
+
+    start = time.perf_counter()
+    for i in range(args.notifications):
+        kind = 'DANGER' if rng.random() < args.danger_share else rng.choice(other_kinds)
+        dispatcher.submit(make_notification(f"child-{rng.randrange(args.children):04d}", kind, f"Load test {i}"))
+        # Yield now and then, as a producer sharing the loop would, and
+        # hold the submit rate to --rate when one is given.
+        if i % args.burst == args.burst - 1:
+            ahead = (i + 1) / args.rate - (time.perf_counter() - start) if args.rate else 0.0
+            await asyncio.sleep(max(ahead, 0.0))
+    await dispatcher.close()
+    seconds = time.perf_counter() - start
+    return dispatcher.metrics(), seconds
+
+async def check_dedup():
+    """Regression check: a DANGER that never reached anyone, because the
+    queue was full or delivery gave up, must not suppress the next one.
+    Returns a list of failure messages."""
+    failures = []
+
+    dispatcher = NotificationDispatcher(LocalSink(), queue_size=1)
+    await dispatcher.start()
+    dispatcher.submit(make_notification('a', 'DANGER', "fills the queue"))
+    if dispatcher.submit(make_notification('b', 'DANGER', "dropped")):
+        failures.append("full queue: expected the second DANGER to be dropped")
+    await dispatcher.join()
+    if not dispatcher.submit(make_notification('b', 'DANGER', "retry after drop")):
+        failures.append("full queue: a dropped DANGER suppressed the retry")
+    await dispatcher.close()
+
+    dispatcher = NotificationDispatcher(LocalSink(failure_rate=1.0), max_attempts=2, backoff=0.001)
+    await dispatcher.start()
+    dispatcher.submit(make_notification('a', 'DANGER', "never delivered"))
+    await dispatcher.join()
+    if not dispatcher.dead_letters:
+        failures.append("dead letter: expected the DANGER to be dead-lettered")
+    if not dispatcher.submit(make_notification('a', 'DANGER', "retry after dead letter")):
+        failures.append("dead letter: an undelivered DANGER suppressed the retry")
+    dispatcher.sink.failure_rate = 0.0
+    await dispatcher.close()
+
+    if not failures:
+        dispatcher = NotificationDispatcher(LocalSink())
+        await dispatcher.start()
+        dispatcher.submit(make_notification('a', 'DANGER', "delivered"))
+        await dispatcher.join()
+        if dispatcher.submit(make_notification('a', 'DANGER', "repeat")):
+            failures.append("delivered DANGER: expected the repeat to be deduplicated")
+        await dispatcher.close()
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the notification dispatcher against a local sink")
+    parser.add_argument('--check', action='store_true', help="Run the deduplication regression check and exit")
+    parser.add_argument('--notifications', type=int, default=100000)
+    parser.add_argument('--children', type=int, default=1000)
+    parser.add_argument('--danger-share', type=float, default=0.8, help="Fraction of notifications that are DANGER")
+    parser.add_argument('--rate', type=float, default=0.0, help="Notifications per second (default: as fast as possible)")
+    parser.add_argument('--burst', type=int, default=100, help="Notifications submitted between yields to the loop")
+    parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE)
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--sink-delay', type=float, default=0.002, help="Seconds per sink call")
+    parser.add_argument('--failure-rate', type=float, default=0.05, help="Fraction of sink calls that fail")
+    parser.add_argument('--backoff', type=float, default=0.01, help="First retry delay in seconds")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = asyncio.run(check_dedup())
+        for failure in failures:
+            print(f"FAIL {failure}", file=sys.stderr)
+        print(f"Deduplication check: {'failed' if failures else 'passed'}", file=sys.stderr)
+        return 1 if failures else 0
+
+    metrics, seconds = asyncio.run(load_test(args))
+    latency = metrics['queue_latency_ms'] or {}
+    print(f"{args.notifications:,} submitted in {seconds:.2f} s: {metrics['submitted']:,} queued, "
+          f"{metrics['deduplicated']:,} deduplicated, {metrics['dropped']:,} dropped; "
+          f"{metrics['delivered']:,} deliveries in {metrics['batches']:,} batches "
+          f"({metrics['delivered'] / seconds:,.0f}/s), {metrics['retries']:,} retries, {metrics['failed']:,} failed; "
+          f"{metrics['senders_retired']:,} idle senders retired", file=sys.stderr)
+    if latency:
+        print(f"Queue latency p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms",
+              file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: ON-DISK PHOTO STORE
+# ----------------------------------------------------------------------
+
+# Each capture is kept as <PHOTO_DIR>/<photo_id>.jpg beside a downscaled
+# <photo_id>.thumb.jpg; sessions hold only the photo id.
+PHOTO_DIR = 'photos'
+PHOTO_SUFFIX = '.jpg'
+THUMBNAIL_SUFFIX = '.thumb.jpg'
+THUMBNAIL_SIZE = (320, 320)
+THUMBNAIL_QUALITY = 80
+COPY_BUFFER = 256 * 1024
+
+def photo_id(child_id, upload_id):
+    """File-name-safe id for one capture of one child."""
+    return re.sub(r'[^A-Za-z0-9_-]', '_', f"{child_id}-{upload_id}")
+
+def make_thumbnail(source, target, size=THUMBNAIL_SIZE):
+    from PIL import Image
+    with Image.open(source) as image:
+        # For JPEGs, draft() decodes straight at a reduced scale, so the
+        # full-resolution frame never has to be held in memory.
+        image.draft('RGB', size)
+        image = image.convert('RGB')
+        image.thumbnail(size)
+        partial = target + '.part'
+        image.save(partial, 'JPEG', quality=THUMBNAIL_QUALITY)
+    os.replace(partial, target)
+    return target
+
+class PhotoStore:
+    """Emergency photos written to disk once, thumbnailed off the script thread.
+
+    save() streams the upload to disk and queues the thumbnail on a small
+    thread pool; pages then show thumbnail(), a file of a few kilobytes,
+    instead of keeping the full-resolution capture in session state.
+    """
+
+    def __init__(self, root=PHOTO_DIR, workers=1, thumbnail_size=THUMBNAIL_SIZE):
+        self.root = root
+        self.thumbnail_size = thumbnail_size
+        os.makedirs(root, exist_ok=True)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='thumbnail')
+        self.lock = threading.Lock()
+        # photo_id -> Future of its thumbnail, until the thumbnail exists.
+        self.pending = {}
+
+    def photo_path(self, photo_id):
+        return os.path.join(self.root, photo_id + PHOTO_SUFFIX)
+
+    def thumbnail_path(self, photo_id):
+        return os.path.join(self.root, photo_id + THUMBNAIL_SUFFIX)
+
+    def save(self, upload, photo_id):
+        """Write a file-like capture under `photo_id`; False if it was already saved."""
+        path = self.photo_path(photo_id)
+        with self.lock:
+            if photo_id in self.pending or os.path.exists(path):
+                return False
+            partial = path + '.part'
+            upload.seek(0)
+            with open(partial, 'wb') as f:
+                shutil.copyfileobj(upload, f, COPY_BUFFER)
+            os.replace(partial, path)
+
+            future = self.executor.submit(make_thumbnail, path, self.thumbnail_path(photo_id), self.thumbnail_size)
+            self.pending[photo_id] = future
+        future.add_done_callback(lambda _: self._finished(photo_id))
+        return True
+
+    def thumbnail(self, photo_id, timeout=None):
+        """Thumbnail path, waiting up to `timeout` s while it is made; None if not ready or failed."""
+        with self.lock:
+            future = self.pending.get(photo_id)
+        if future is not None:
+            try:
+                future.result(timeout)
+            except Exception:
+                return None
+        path = self.thumbnail_path(photo_id)
+        return path if os.path.exists(path) else None
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def _finished(self, photo_id):
+        with self.lock:
+            self.pending.pop(photo_id, None)
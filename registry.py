@@ -0,0 +1,288 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+from inference import default_model_path, load_model_file
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: REGISTRY LAYOUT
+# ----------------------------------------------------------------------
+
+# A registry is a directory of versioned model artifacts (pickles, or
+# flat exports, which are directories) plus manifest.json:
+#   {"current": 3, "versions": {"3": {"path": "swiri_rf_model-v0003.pkl",
+#    "sha256": "...", "flat": "swiri_rf_model-v0003.flat",
+#    "flat_sha256": "...", "registered": "..."}, ...}}
+# "path" is what retrain.py refits from; "flat", when present, is the
+# same forest as a flat export, which is what gets served: it maps in
+# about 0.1 s where unpickling the forest takes seconds.
+# The manifest is only ever replaced whole (write, then rename), so a
+# reader sees either the old or the new one. Artifacts are written the
+# same way before they are registered.
+MODEL_REGISTRY = 'models'
+MANIFEST = 'manifest.json'
+MODEL_NAME = 'swiri_rf_model'
+VERSION_PATTERN = re.compile(rf'^{MODEL_NAME}-v(\d+)\.pkl$')
+CHECKSUM_BLOCK = 1024 * 1024
+
+def artifact_checksum(path):
+    """SHA-256 of a model file, or of every file in a flat model directory."""
+    digest = hashlib.sha256()
+    if os.path.isdir(path):
+        files = sorted(os.path.relpath(os.path.join(root, name), path)
+                       for root, _, names in os.walk(path) for name in names)
+    else:
+        files = [None]
+    for name in files:
+        if name is not None:
+            digest.update(name.encode() + b'\0')
+        with open(path if name is None else os.path.join(path, name), 'rb') as f:
+            for block in iter(lambda: f.read(CHECKSUM_BLOCK), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+def read_manifest(registry=MODEL_REGISTRY):
+    try:
+        with open(os.path.join(registry, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'current': None, 'versions': {}}
+
+def write_manifest(manifest, registry=MODEL_REGISTRY):
+    path = os.path.join(registry, MANIFEST)
+    with open(path + '.part', 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + '.part', path)
+
+def model_versions(registry=MODEL_REGISTRY):
+    """{version: path} of every versioned pickle in `registry`, registered or not."""
+    if not os.path.isdir(registry):
+        return {}
+    versions = {}
+    for name in os.listdir(registry):
+        match = VERSION_PATTERN.match(name)
+        if match:
+            versions[int(match.group(1))] = os.path.join(registry, name)
+    return versions
+
+def next_version(registry=MODEL_REGISTRY):
+    registered = [int(version) for version in read_manifest(registry)['versions']]
+    return max(registered + list(model_versions(registry)), default=0) + 1
+
+def register(path, version, registry=MODEL_REGISTRY, activate=True, flat_path=None):
+    """Checksum an artifact (and its flat export) inside `registry` and
+    add it to the manifest."""
+    manifest = read_manifest(registry)
+    entry = {
+        'path': os.path.relpath(path, registry),
+        'sha256': artifact_checksum(path),
+        'registered': time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    if flat_path is not None:
+        entry.update(flat=os.path.relpath(flat_path, registry), flat_sha256=artifact_checksum(flat_path))
+    manifest['versions'][str(version)] = entry
+    if activate:
+        manifest['current'] = version
+    write_manifest(manifest, registry)
+    return version
+
+def publish(model, info, registry=MODEL_REGISTRY, activate=True):
+    """Save a fitted model as the next version, pickle and flat export,
+    and register both."""
+    import joblib
+    import shutil
+    from flat_forest import FlatForest, save_flat_model
+    os.makedirs(registry, exist_ok=True)
+    version = next_version(registry)
+    path = os.path.join(registry, f"{MODEL_NAME}-v{version:04d}.pkl")
+    flat_path = path[:-len('.pkl')] + '.flat'
+    # Written under temporary names and renamed, so the watcher never
+    # checksums a half-written version.
+    joblib.dump(model, path + '.part')
+    shutil.rmtree(flat_path + '.part', ignore_errors=True)
+    save_flat_model(FlatForest.from_sklearn(model), flat_path + '.part')
+    with open(path[:-len('.pkl')] + '.json', 'w') as f:
+        json.dump(dict(info, version=version), f, indent=2)
+    os.replace(path + '.part', path)
+    os.replace(flat_path + '.part', flat_path)
+    register(path, version, registry, activate, flat_path)
+    return version, path
+
+def activate(version, registry=MODEL_REGISTRY):
+    """Point the registry at an existing version, e.g. to roll back."""
+    manifest = read_manifest(registry)
+    if str(version) not in manifest['versions']:
+        raise ValueError(f"Version {version} is not registered in {registry}")
+    manifest['current'] = int(version)
+    write_manifest(manifest, registry)
+
+def current_artifact(registry=MODEL_REGISTRY, flat=False):
+    """(version, path, sha256) of the current version, or None. With
+    flat=True, its flat export is preferred when it has one."""
+    manifest = read_manifest(registry)
+    if manifest.get('current') is None:
+        return None
+    entry = manifest['versions'][str(manifest['current'])]
+    if flat and 'flat' in entry:
+        return int(manifest['current']), os.path.join(registry, entry['flat']), entry['flat_sha256']
+    return int(manifest['current']), os.path.join(registry, entry['path']), entry['sha256']
+
+def load_verified(path, sha256):
+    actual = artifact_checksum(path)
+    if actual != sha256:
+        raise ValueError(f"Checksum mismatch for {path}: manifest {sha256[:12]}, file {actual[:12]}")
+    return load_model_file(path)
+
+# ----------------------------------------------------------------------
+# SECTION 2: HOT RELOAD
+# ----------------------------------------------------------------------
+
+POLL_SECONDS = 2.0
+
+class HotModel:
+    """The registry's current model, swapped in place when it changes.
+
+    get() is a single attribute read, so a caller that takes the model
+    once per request finishes that request on it even if a swap lands
+    mid-way; the old model is freed once the last such caller drops it.
+    A watcher thread polls the manifest, verifies and loads the new
+    version (its flat export when it has one) and scores a warm-up batch
+    with it before swapping, so the load cost never lands on a request.
+    Without a registry, the default model file is served.
+    """
+
+    def __init__(self, registry=MODEL_REGISTRY, poll_seconds=POLL_SECONDS, fallback_path=None):
+        self.registry = registry
+        self.poll_seconds = poll_seconds
+        self.fallback_path = fallback_path
+        # (version, model); replaced whole so readers never see a mix.
+        self.current = (None, None)
+        self.reloads = 0
+        self.last_error = None
+        self.manifest_stamp = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def get(self):
+        return self.current[1]
+
+    @property
+    def version(self):
+        return self.current[0]
+
+    def start(self):
+        """Load the current version now, then keep watching in the background."""
+        self.check()
+        if self.current[1] is None:
+            fallback = self.fallback_path or default_model_path()
+            self.current = (None, warm_up(load_model_file(fallback)))
+        self.thread = threading.Thread(target=self._watch, name='model-watcher', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def check(self):
+        """Swap in the registry's current version if it changed; True if swapped."""
+        manifest_path = os.path.join(self.registry, MANIFEST)
+        try:
+            stat = os.stat(manifest_path)
+        except FileNotFoundError:
+            return False
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self.manifest_stamp:
+            return False
+
+        try:
+            artifact = current_artifact(self.registry, flat=True)
+            if artifact is None or artifact[0] == self.current[0]:
+                self.manifest_stamp = stamp
+                return False
+            version, path, sha256 = artifact
+            model = warm_up(load_verified(path, sha256))
+        except Exception as e:
+            # Keep serving the old model; a later manifest change retries.
+            self.last_error = f"{type(e).__name__}: {e}"
+            self.manifest_stamp = stamp
+            return False
+
+        self.current = (version, model)
+        self.manifest_stamp = stamp
+        self.reloads += 1
+        self.last_error = None
+        return True
+
+    def _watch(self):
+        while not self.stop_event.wait(self.poll_seconds):
+            self.check()
+
+def warm_up(model):
+    """Score one throwaway batch so first-call costs (page faults on a
+    mapped flat model, lazy sklearn setup) are paid before serving."""
+    from features import model_features
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model.predict_proba(np.zeros((64, len(model_features(model)))))
+    return model
+
+# ----------------------------------------------------------------------
+# SECTION 3: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and manage the SWIRI model registry")
+    parser.add_argument('--registry', default=MODEL_REGISTRY)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help="List registered versions")
+    commands.add_parser('verify', help="Check every artifact against its manifest checksum")
+    activate_parser = commands.add_parser('activate', help="Make a registered version current (e.g. roll back)")
+    activate_parser.add_argument('version', type=int)
+    register_parser = commands.add_parser('register', help="Register an artifact already inside the registry")
+    register_parser.add_argument('path')
+    register_parser.add_argument('--no-activate', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'activate':
+        activate(args.version, args.registry)
+        print(f"Version {args.version} is now current")
+        return 0
+    if args.command == 'register':
+        if os.path.dirname(os.path.abspath(args.path)) != os.path.abspath(args.registry):
+            print(f"Copy {args.path} into {args.registry} first", file=sys.stderr)
+            return 2
+        version = register(args.path, next_version(args.registry), args.registry, not args.no_activate)
+        print(f"Registered {args.path} as version {version}")
+        return 0
+
+    manifest = read_manifest(args.registry)
+    status = 0
+    for version, entry in sorted(manifest['versions'].items(), key=lambda item: int(item[0])):
+        line = f"{'*' if int(version) == manifest.get('current') else ' '} v{int(version):04d} {entry['path']} " \
+               f"{entry['sha256'][:12]} {entry['registered']}"
+        if 'flat' in entry:
+            line += f" + {entry['flat']}"
+        if args.command == 'verify':
+            ok = all(os.path.exists(os.path.join(args.registry, entry[key]))
+                     and artifact_checksum(os.path.join(args.registry, entry[key])) == entry[checksum]
+                     for key, checksum in (('path', 'sha256'), ('flat', 'flat_sha256')) if key in entry)
+            status = status or (0 if ok else 1)
+            line += "  OK" if ok else "  MISMATCH"
+        print(line)
+    return status
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,316 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from features import SAMPLE_RATE_HZ, WINDOW_SIZE
+from inference import LABELS, default_model_path, featurize, load_model_file, score_batch
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: TRACE READERS
+# ----------------------------------------------------------------------
+
+# A recorded trace is a table of samples with 'heart_rate' and
+# 'accelerometer' columns, plus optional 'child_id' and 'timestamp'.
+# Samples of one child must appear in time order; children may be
+# interleaved. Readers yield dicts of 1-D column arrays, at most
+# `chunk_samples` samples at a time, so memory stays bounded by one chunk.
+TRACE_COLUMNS = ['child_id', 'timestamp', 'heart_rate', 'accelerometer']
+SAMPLE_COLUMNS = ['heart_rate', 'accelerometer']
+CHUNK_SAMPLES = 1000000
+
+def iter_csv(path, chunk_samples=CHUNK_SAMPLES):
+    import pandas as pd
+    columns = pd.read_csv(path, nrows=0).columns
+    usecols = [name for name in TRACE_COLUMNS if name in columns]
+    for frame in pd.read_csv(path, usecols=usecols, chunksize=chunk_samples):
+        yield {name: frame[name].to_numpy() for name in usecols}
+
+def iter_parquet(path, chunk_samples=CHUNK_SAMPLES):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet traces needs pyarrow (pip install pyarrow)")
+    trace = pq.ParquetFile(path)
+    usecols = [name for name in TRACE_COLUMNS if name in trace.schema_arrow.names]
+    for batch in trace.iter_batches(batch_size=chunk_samples, columns=usecols):
+        # String columns and columns with nulls cannot be viewed zero-copy;
+        # nulls come back as NaN (or None in a string column), as from CSV.
+        yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in usecols}
+
+def iter_npy(path, chunk_samples=CHUNK_SAMPLES):
+    """Chunked reads of .npy traces.
+
+    Either one (N, 2) file of heart_rate, accelerometer samples, or a
+    directory holding one 1-D .npy file per trace column. A directory
+    written by sensors.write_workload, whose sample columns are (N,
+    window) rows of windows, is read as each row's samples in turn, with
+    the row's other columns repeated per sample; its windows are in time
+    order per child, so replaying it with the same window gives back
+    exactly its rows. Chunks are read straight from the file at the
+    array's data offset rather than through a memory map, whose pages
+    would stay resident as the replay advances.
+    """
+    if os.path.isdir(path):
+        files = {
+            name: os.path.join(path, f"{name}.npy")
+            for name in TRACE_COLUMNS if os.path.exists(os.path.join(path, f"{name}.npy"))
+        }
+        readers = {name: NpyReader(file) for name, file in files.items()}
+        width = directory_row_width(path, readers)
+    else:
+        reader = NpyReader(path)
+        if len(reader.shape) != 2 or reader.shape[1] != len(SAMPLE_COLUMNS):
+            raise ValueError(f"Expected an (N, 2) array of samples in {path}, got shape {reader.shape}")
+        readers = {'samples': reader}
+        width = 1
+
+    try:
+        total = next(iter(readers.values())).shape[0]
+        rows_per_chunk = max(1, chunk_samples // width)
+        for start in range(0, total, rows_per_chunk):
+            chunk = {name: reader.read(start, rows_per_chunk) for name, reader in readers.items()}
+            if 'samples' in chunk:
+                samples = chunk.pop('samples')
+                chunk = {name: samples[:, i] for i, name in enumerate(SAMPLE_COLUMNS)}
+            elif width > 1:
+                chunk = {name: values.ravel() if name in SAMPLE_COLUMNS else np.repeat(values, width)
+                         for name, values in chunk.items()}
+            yield chunk
+    finally:
+        for reader in readers.values():
+            reader.close()
+
+def directory_row_width(path, readers):
+    """Samples per row of a column directory: 1 for a trace of 1-D
+    columns, the window length for a sensors.write_workload directory."""
+    try:
+        missing = [name for name in SAMPLE_COLUMNS if name not in readers]
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(f'{name}.npy' for name in missing)}")
+        shapes = {name: reader.shape for name, reader in readers.items()}
+        sample_shape = shapes[SAMPLE_COLUMNS[0]]
+        if any(shapes[name] != sample_shape for name in SAMPLE_COLUMNS):
+            raise ValueError(f"Sample columns in {path} differ in shape: "
+                             f"{', '.join(f'{name} {shapes[name]}' for name in SAMPLE_COLUMNS)}")
+        bad = [f"{name} {shape}" for name, shape in shapes.items()
+               if name not in SAMPLE_COLUMNS and shape != sample_shape[:1]]
+        if bad:
+            raise ValueError(f"Columns in {path} must have one value per "
+                             f"{'row' if len(sample_shape) == 2 else 'sample'} "
+                             f"({sample_shape[0]}), got {', '.join(bad)}")
+    except ValueError:
+        for reader in readers.values():
+            reader.close()
+        raise
+    return sample_shape[1] if len(sample_shape) == 2 else 1
+
+class NpyReader:
+    """Row-range reads from a .npy file without mapping it."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        version = np.lib.format.read_magic(self.file)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(self.file)
+        else:
+            header = np.lib.format.read_array_header_2_0(self.file)
+        self.shape, self.fortran_order, self.dtype = header
+        if self.dtype.hasobject or len(self.shape) not in (1, 2):
+            self.file.close()
+            raise ValueError(f"{path} must hold a 1-D or 2-D numeric array")
+        self.offset = self.file.tell()
+        self.columns = self.shape[1] if len(self.shape) == 2 else 1
+
+    def read(self, start, rows):
+        rows = max(0, min(rows, self.shape[0] - start))
+        if not self.fortran_order or self.columns == 1:
+            return self._read_at(start * self.columns, rows * self.columns).reshape((rows,) + self.shape[1:])
+        # Column-major: each column is contiguous, so read one run per column.
+        return np.column_stack([
+            self._read_at(column * self.shape[0] + start, rows) for column in range(self.columns)
+        ])
+
+    def close(self):
+        self.file.close()
+
+    def _read_at(self, item, count):
+        self.file.seek(self.offset + item * self.dtype.itemsize)
+        return np.fromfile(self.file, dtype=self.dtype, count=count)
+
+def iter_trace(path, chunk_samples=CHUNK_SAMPLES):
+    if path.endswith('.csv') or path.endswith('.csv.gz'):
+        return iter_csv(path, chunk_samples)
+    if path.endswith('.parquet') or path.endswith('.pq'):
+        return iter_parquet(path, chunk_samples)
+    if path.endswith('.npy') or os.path.isdir(path):
+        return iter_npy(path, chunk_samples)
+    raise ValueError(f"Unrecognised trace format: {path} (expected .csv, .parquet, .npy or a directory)")
+
+# ----------------------------------------------------------------------
+# SECTION 2: WINDOWING
+# ----------------------------------------------------------------------
+
+class TraceWindower:
+    """Cut a stream of sample chunks into fixed windows per child.
+
+    Windows hold `window` consecutive samples of one child and start
+    every `step` samples (step == window gives back-to-back windows, as
+    the app uses). Samples that do not yet fill a window are carried over
+    to the next chunk, so window boundaries do not depend on chunking.
+    """
+
+    def __init__(self, window=WINDOW_SIZE, step=None):
+        self.window = window
+        self.step = window if step is None else step
+        if self.window < 1 or self.step < 1:
+            raise ValueError("window and step must be at least 1 sample")
+        # child_id -> (carried-over columns, index of its next window)
+        self.pending = {}
+
+    def push(self, chunk):
+        """Return the windows completed by this chunk, or None."""
+        n = len(chunk['heart_rate'])
+        child = chunk.get('child_id')
+        if child is None or n == 0:
+            segments = [(0, slice(None))] if n else []
+        else:
+            # Stable sort keeps each child's samples in time order.
+            child = np.asarray(child)
+            order = np.argsort(child, kind='stable')
+            ordered = child[order]
+            bounds = np.concatenate([[0], np.flatnonzero(ordered[1:] != ordered[:-1]) + 1, [n]])
+            ids = ordered[bounds[:-1]].tolist()
+            segments = [(child_id, order[lo:hi]) for child_id, lo, hi in zip(ids, bounds[:-1], bounds[1:])]
+
+        parts = []
+        for child_id, rows in segments:
+            columns = {
+                name: np.asarray(chunk[name])[rows]
+                for name in ('timestamp', 'heart_rate', 'accelerometer') if name in chunk
+            }
+            windows = self._cut(child_id, columns)
+            if windows is not None:
+                parts.append(windows)
+
+        if not parts:
+            return None
+        return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+    def dropped_samples(self):
+        """Samples still waiting for a window, e.g. at the end of a trace."""
+        return sum(len(columns['heart_rate']) for columns, _ in self.pending.values())
+
+    def _cut(self, child_id, columns):
+        carried, next_index = self.pending.get(child_id, (None, 0))
+        if carried is not None:
+            columns = {name: np.concatenate([carried[name], columns[name]]) for name in columns}
+
+        length = len(columns['heart_rate'])
+        count = (length - self.window) // self.step + 1 if length >= self.window else 0
+        consumed = count * self.step
+        self.pending[child_id] = ({name: values[consumed:] for name, values in columns.items()},
+                                  next_index + count)
+        if count == 0:
+            return None
+
+        windows = {
+            'child_id': np.full(count, child_id),
+            'window_index': np.arange(next_index, next_index + count)
+        }
+        for name in SAMPLE_COLUMNS:
+            windows[name] = self._windows(np.asarray(columns[name], dtype=np.float64), count)
+        if 'timestamp' in columns:
+            windows['timestamp'] = columns['timestamp'][:consumed:self.step]
+        return windows
+
+    def _windows(self, values, count):
+        if self.step == self.window:
+            return values[:count * self.window].reshape(count, self.window)
+        views = np.lib.stride_tricks.sliding_window_view(values, self.window)
+        return views[:count * self.step:self.step]
+
+# ----------------------------------------------------------------------
+# SECTION 3: REPLAY
+# ----------------------------------------------------------------------
+
+def replay(path, model, window=WINDOW_SIZE, step=None, chunk_samples=CHUNK_SAMPLES, stats=None):
+    """Yield predictions for a recorded trace, one dict of arrays per chunk.
+
+    Each dict holds child_id, window_index, prediction and confidence
+    (plus timestamp, the window's first sample time, when the trace has
+    one). Pass a dict as `stats` to collect sample, window and dropped
+    sample counts.
+    """
+    windower = TraceWindower(window, step)
+    samples = windows = 0
+
+    for chunk in iter_trace(path, chunk_samples):
+        samples += len(chunk['heart_rate'])
+        cut = windower.push(chunk)
+        if cut is None:
+            continue
+        X = featurize(model, cut['heart_rate'], cut['accelerometer'])
+        predictions, confidences = score_batch(model, X)
+        windows += len(predictions)
+
+        result = {'child_id': cut['child_id'], 'window_index': cut['window_index']}
+        if 'timestamp' in cut:
+            result['timestamp'] = cut['timestamp']
+        result['prediction'] = predictions
+        result['confidence'] = confidences
+        yield result
+
+    if stats is not None:
+        stats.update(samples=samples, windows=windows, dropped_samples=windower.dropped_samples())
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def write_csv(out, result, header):
+    columns = list(result)
+    if header:
+        out.write(",".join(columns) + "\n")
+    rows = zip(*(result[name].tolist() for name in columns))
+    out.write("".join(",".join(map(str, row)) + "\n" for row in rows))
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded watch trace through the SWIRI model")
+    parser.add_argument('trace', help="Trace file (.csv, .parquet, .npy) or a directory of .npy columns")
+    parser.add_argument('--model', default=None, help="Model path (default: flat export if present, else the pickle)")
+    parser.add_argument('--output', default=None, help="CSV file for predictions (default: stdout)")
+    parser.add_argument('--chunk', type=int, default=CHUNK_SAMPLES, help="Samples read per chunk")
+    parser.add_argument('--step', type=int, default=None, help="Samples between window starts (default: window size)")
+    parser.add_argument('--quiet', action='store_true', help="Only print the summary")
+    args = parser.parse_args()
+
+    model = load_model_file(args.model or default_model_path())
+    stats = {}
+    label_counts = np.zeros(len(LABELS), dtype=np.int64)
+    out = None if args.quiet else (open(args.output, 'w') if args.output else sys.stdout)
+
+    start = time.perf_counter()
+    try:
+        for i, result in enumerate(replay(args.trace, model, step=args.step, chunk_samples=args.chunk, stats=stats)):
+            label_counts += np.bincount(np.searchsorted(model.classes_, result['prediction']),
+                                        minlength=len(LABELS))[:len(LABELS)]
+            if out is not None:
+                write_csv(out, result, header=(i == 0))
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+    seconds = time.perf_counter() - start
+
+    speedup = stats['samples'] / SAMPLE_RATE_HZ / seconds if seconds > 0 else float('inf')
+    summary = ", ".join(f"{LABELS[i]} {count:,}" for i, count in enumerate(label_counts))
+    print(f"Replayed {stats['samples']:,} samples into {stats['windows']:,} windows in {seconds:.2f} s "
+          f"({stats['samples'] / seconds:,.0f} samples/s, {speedup:,.0f}x real time); {summary}; "
+          f"{stats['dropped_samples']:,} trailing samples did not fill a window", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,183 @@
+import argparse
+import copy
+import sys
+import time
+
+import numpy as np
+
+from feedback import FEEDBACK_DIR, iter_feedback
+from features import compute_feature_matrix, model_features
+from flat_forest import is_flat_model
+from inference import LABELS, MODEL_PATH, load_model_file
+from registry import MODEL_REGISTRY, current_artifact, publish
+from sensors import generate_windows
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: TRAINING DATA
+# ----------------------------------------------------------------------
+
+# Feedback is read and featurized this many windows at a time, so
+# memory stays bounded by one chunk of raw windows plus the
+# (N, n_features) matrix.
+FEATURE_CHUNK = 100000
+
+# Freshly simulated windows, balanced across scenarios, are mixed in so a
+# refit never sees only the (DANGER-heavy) feedback. Parent verdicts are
+# the better labels and get FEEDBACK_WEIGHT times the weight.
+SYNTHETIC_WINDOWS = 30000
+FEEDBACK_WEIGHT = 5.0
+
+def feedback_matrix(path, names, chunk=FEATURE_CHUNK):
+    """(X, y, skipped): features and training labels of every feedback
+    record with a full window, and the count of records without one."""
+    features, labels = [np.empty((0, len(names)))], [np.empty(0, dtype=np.int64)]
+    skipped = 0
+    for records in iter_feedback(path, chunk):
+        hr = records['heart_rate'].astype(np.float64)
+        acc = records['accelerometer'].astype(np.float64)
+        complete = np.isfinite(hr).all(axis=1) & np.isfinite(acc).all(axis=1)
+        skipped += int(len(records) - np.count_nonzero(complete))
+        if complete.any():
+            features.append(compute_feature_matrix(hr[complete], acc[complete], names))
+            labels.append(records['label'][complete].astype(np.int64))
+    return np.concatenate(features), np.concatenate(labels), skipped
+
+def synthetic_matrix(n_windows, names, rng):
+    codes = np.arange(n_windows) % len(LABELS)
+    heart_rate, accelerometer = generate_windows(codes, rng)
+    return compute_feature_matrix(heart_rate, accelerometer, names), codes
+
+def training_frame(model, X):
+    # Fitting on a DataFrame keeps feature_names_in_, which is how the
+    # refit model declares its features (see features.model_features).
+    import pandas as pd
+    columns = getattr(model, 'feature_names_in_', None)
+    return pd.DataFrame(X, columns=list(columns) if columns is not None else model_features(model))
+
+# ----------------------------------------------------------------------
+# SECTION 2: REFIT
+# ----------------------------------------------------------------------
+
+# Each tree is fitted on a bootstrap sample of at most this many rows,
+# so a refit costs the same on one million windows as on one hundred
+# thousand; only featurization grows with the data, and it is vectorized.
+MAX_SAMPLES_PER_TREE = 100000
+
+def refit(model, X, y, sample_weight=None, new_trees=None, n_jobs=-1, max_samples=MAX_SAMPLES_PER_TREE):
+    """Return a copy of `model` refitted on (X, y); `model` itself is untouched.
+
+    By default every tree is grown again, so the feedback reaches the
+    whole vote. With `new_trees`, only that many trees are grown (warm
+    start) and the same number of the oldest retired: faster, but the
+    kept trees still vote as before, so replacing k of n trees can move
+    a window's probability by at most k/n and a confident false alarm
+    survives a small k. Trees are fitted in parallel over n_jobs cores.
+    """
+    model = copy.deepcopy(model)
+    n_trees = len(model.estimators_)
+    full = new_trees is None
+    labels = np.unique(y)
+    if not full and not np.array_equal(labels, model.classes_):
+        raise ValueError(f"Incremental refit needs every class {model.classes_.tolist()} in the data, "
+                         f"got {labels.tolist()}")
+    if not full and not 0 < new_trees <= n_trees:
+        raise ValueError(f"new_trees must be between 1 and {n_trees}")
+
+    params = {'n_jobs': n_jobs, 'verbose': 0}
+    if model.bootstrap:
+        params['max_samples'] = min(len(y), max_samples)
+    if full:
+        params.update(warm_start=False, n_estimators=n_trees)
+    else:
+        params.update(warm_start=True, n_estimators=n_trees + new_trees)
+    model.set_params(**params)
+    model.fit(training_frame(model, X), y, sample_weight=sample_weight)
+
+    if not full:
+        model.estimators_ = model.estimators_[new_trees:]
+        model.n_estimators = n_trees
+    model.set_params(warm_start=False, n_jobs=None)
+    return model
+
+def accuracy(model, X, y):
+    if len(y) == 0:
+        return None
+    return float(np.mean(model.predict(training_frame(model, X)) == y))
+
+# ----------------------------------------------------------------------
+# SECTION 3: VERSIONED OUTPUT
+# ----------------------------------------------------------------------
+
+def base_model_path(registry=MODEL_REGISTRY):
+    """The registry's current version, else the shipped model."""
+    artifact = current_artifact(registry)
+    return artifact[1] if artifact is not None else MODEL_PATH
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Refit the SWIRI forest on parent feedback")
+    parser.add_argument('--feedback', default=FEEDBACK_DIR, help="Feedback directory")
+    parser.add_argument('--model', default=None, help="Base model pickle (default: current version, else the shipped model)")
+    parser.add_argument('--registry', default=MODEL_REGISTRY, help="Model registry the new version is published to")
+    parser.add_argument('--no-activate', action='store_true', help="Publish without making it the current version")
+    parser.add_argument('--jobs', type=int, default=-1, help="Parallel tree fits (default: all cores)")
+    parser.add_argument('--new-trees', type=int, default=None,
+                        help="Only replace this many of the oldest trees (faster; default: refit every tree)")
+    parser.add_argument('--synthetic', type=int, default=SYNTHETIC_WINDOWS, help="Simulated windows mixed in")
+    parser.add_argument('--feedback-weight', type=float, default=FEEDBACK_WEIGHT)
+    parser.add_argument('--max-samples', type=int, default=MAX_SAMPLES_PER_TREE, help="Bootstrap rows per tree")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    base_path = args.model or base_model_path(args.registry)
+    if is_flat_model(base_path):
+        print(f"{base_path} is a flat export; retraining needs the scikit-learn pickle", file=sys.stderr)
+        return 2
+    model = load_model_file(base_path)
+    names = model_features(model)
+    rng = np.random.default_rng(args.seed)
+
+    start = time.perf_counter()
+    X_feedback, y_feedback, skipped = feedback_matrix(args.feedback, names)
+    X_synthetic, y_synthetic = synthetic_matrix(args.synthetic, names, rng)
+    X = np.concatenate([X_feedback, X_synthetic])
+    y = np.concatenate([y_feedback, y_synthetic])
+    weights = np.concatenate([np.full(len(y_feedback), args.feedback_weight), np.ones(len(y_synthetic))])
+    featurized = time.perf_counter()
+
+    retrained = refit(model, X, y, weights, new_trees=args.new_trees, n_jobs=args.jobs, max_samples=args.max_samples)
+    fitted = time.perf_counter()
+
+    X_holdout, y_holdout = synthetic_matrix(6000, names, rng)
+    info = {
+        'base_model': base_path,
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'features': names,
+        'feedback_windows': int(len(y_feedback)),
+        'feedback_skipped': skipped,
+        'synthetic_windows': int(len(y_synthetic)),
+        'mode': 'full' if args.new_trees is None else f"replace {args.new_trees} trees",
+        'featurize_seconds': featurized - start,
+        'fit_seconds': fitted - featurized,
+        'holdout_accuracy': {'base': accuracy(model, X_holdout, y_holdout),
+                             'retrained': accuracy(retrained, X_holdout, y_holdout)},
+        'feedback_accuracy': {'base': accuracy(model, X_feedback, y_feedback),
+                              'retrained': accuracy(retrained, X_feedback, y_feedback)}
+    }
+    version, path = publish(retrained, info, args.registry, activate=not args.no_activate)
+
+    def pct(value):
+        return "n/a" if value is None else f"{value:.1%}"
+    print(f"Wrote version {version} to {path}: {len(y_feedback):,} feedback + {len(y_synthetic):,} simulated "
+          f"windows, featurized in {info['featurize_seconds']:.2f} s, fitted in {info['fit_seconds']:.2f} s; "
+          f"holdout {pct(info['holdout_accuracy']['base'])} -> {pct(info['holdout_accuracy']['retrained'])}, "
+          f"feedback {pct(info['feedback_accuracy']['base'])} -> {pct(info['feedback_accuracy']['retrained'])}",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from features import compute_feature_matrix, model_features
+from inference import LatencyTracker, get_prediction_label, load_model_file, score_batch
+from registry import MODEL_REGISTRY, HotModel
+
+# Headless entry point: this module must never import streamlit, so the
+# service starts in the time it takes to map the model and import NumPy.
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: SCORING PIPELINE
+# ----------------------------------------------------------------------
+
+class ScoringService:
+    """Registry features + model over batches of raw sensor windows.
+
+    A request is {"windows": [{"child_id": ..., "heart_rate": [...],
+    "accelerometer": [...]}, ...]}. `model` is a fitted model, loaded
+    once per process, or a HotModel that follows the registry; each
+    request takes the model once and is scored on it start to finish.
+    """
+
+    def __init__(self, model):
+        self.hot_model = model if isinstance(model, HotModel) else None
+        self.model = model
+        self.tracker = LatencyTracker()
+        self.windows_scored = 0
+
+    def current_model(self):
+        return self.hot_model.get() if self.hot_model is not None else self.model
+
+    def featurize(self, windows, model=None):
+        hr = [window['heart_rate'] for window in windows]
+        acc = [window['accelerometer'] for window in windows]
+        for hr_data, acc_data in zip(hr, acc):
+            if len(hr_data) == 0 or len(hr_data) != len(acc_data):
+                raise ValueError("Each window needs equal-length, non-empty heart_rate and accelerometer")
+
+        # Equal-length windows (the usual 50 samples) featurize in one
+        # vectorized pass; ragged batches fall back to per-window.
+        names = model_features(model if model is not None else self.current_model())
+        if len({len(hr_data) for hr_data in hr}) == 1:
+            return compute_feature_matrix(hr, acc, names)
+        return np.vstack([compute_feature_matrix([h], [a], names) for h, a in zip(hr, acc)])
+
+    def score(self, request):
+        windows = request.get('windows') if isinstance(request, dict) else None
+        if not isinstance(windows, list) or not windows:
+            raise ValueError("Request must contain a non-empty 'windows' list")
+
+        start = time.perf_counter()
+        model = self.current_model()
+        X = self.featurize(windows, model)
+        predictions, confidences = score_batch(model, X)
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.tracker.record(latency_ms)
+        self.windows_scored += len(windows)
+
+        results = [
+            {
+                'child_id': window.get('child_id', i),
+                'prediction': int(pred),
+                'label': get_prediction_label(int(pred)),
+                'confidence': float(conf)
+            }
+            for i, (window, pred, conf) in enumerate(zip(windows, predictions, confidences))
+        ]
+        return {'results': results, 'latency_ms': latency_ms}
+
+    def metrics(self):
+        return {
+            'requests': len(self.tracker),
+            'windows_scored': self.windows_scored,
+            'latency_ms': self.tracker.percentiles(),
+            'model_version': self.hot_model.version if self.hot_model is not None else None,
+            'model_reloads': self.hot_model.reloads if self.hot_model is not None else 0
+        }
+
+# ----------------------------------------------------------------------
+# SECTION 2: HTTP SERVER
+# ----------------------------------------------------------------------
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+async def write_response(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode()
+    writer.write(head + body)
+    await writer.drain()
+
+def route(service, method, path, body):
+    if path == '/health':
+        return 200, {'status': 'ok'}
+    if path == '/metrics':
+        return 200, service.metrics()
+    if path != '/score':
+        return 404, {'error': f"Unknown path {path}"}
+    if method != 'POST':
+        return 405, {'error': "Use POST /score"}
+
+    try:
+        return 200, service.score(json.loads(body))
+    except (ValueError, KeyError, TypeError) as e:
+        return 400, {'error': str(e)}
+
+async def handle_connection(service, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                await write_response(writer, 413, {'error': "Request body too large"}, False)
+                break
+            body = await reader.readexactly(length) if length else b''
+
+            status, payload = route(service, method, path, body)
+            await write_response(writer, status, payload, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def serve_http(service, host, port):
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port
+    )
+    print(f"SWIRI scoring service listening on http://{host}:{port}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+# ----------------------------------------------------------------------
+# SECTION 3: STDIN MODE
+# ----------------------------------------------------------------------
+
+def serve_stdin(service, stdin=sys.stdin, stdout=sys.stdout):
+    # One JSON request per line in, one JSON response per line out.
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            response = service.score(json.loads(line))
+        except (ValueError, KeyError, TypeError) as e:
+            response = {'error': str(e)}
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless SWIRI scoring service")
+    parser.add_argument('--model', default=None, help="Model pickle or flat model directory (fixed for the process)")
+    parser.add_argument('--registry', default=MODEL_REGISTRY,
+                        help="Model registry to follow when --model is not given")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--stdin', action='store_true', help="Read JSON lines from stdin instead of serving HTTP")
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore', message='X does not have valid feature names')
+    if args.model:
+        service = ScoringService(load_model_file(args.model))
+    else:
+        # Serves the registry's current version, or the shipped model
+        # until one is published, and swaps in new versions as they land.
+        service = ScoringService(HotModel(args.registry).start())
+
+    if args.stdin:
+        serve_stdin(service)
+    else:
+        try:
+            asyncio.run(serve_http(service, args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from features import WINDOW_SIZE
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: SCENARIO PROFILES
+# ----------------------------------------------------------------------
+
+# Index in this list is the scenario code, which is also the model label.
+SCENARIOS = ["NORMAL", "PLAYING", "DANGER"]
+
+# Per scenario: heart-rate base, clip range, trend noise, trend rise over
+# the window, accelerometer base and noise. Any unknown scenario falls
+# back to the DANGER profile, as the Smartwatch page always has.
+HR_BASE = np.array([85.0, 110.0, 145.0])
+HR_LOW = np.array([80.0, 100.0, 130.0])
+HR_HIGH = np.array([95.0, 120.0, 160.0])
+HR_TREND_SIGMA = np.array([0.5, 1.0, 2.0])
+HR_TREND_RISE = np.array([0.0, 5.0, 15.0])
+HR_NOISE_SIGMA = 2.0
+ACC_BASE = np.array([0.5, 2.0, 4.0])
+ACC_SIGMA = np.array([0.1, 0.5, 1.5])
+ACC_RANGE = (0.0, 10.0)
+
+def scenario_code(scenario):
+    return SCENARIOS.index(scenario) if scenario in SCENARIOS else SCENARIOS.index("DANGER")
+
+# ----------------------------------------------------------------------
+# SECTION 2: VECTORIZED WINDOW GENERATION
+# ----------------------------------------------------------------------
+
+def generate_windows(codes, rng, window=WINDOW_SIZE, dtype=np.float64):
+    """Heart-rate and accelerometer windows for an array of scenario codes.
+
+    Returns two (N, window) arrays drawn from the same distributions as
+    the original per-window generator, in one pass over the batch.
+    """
+    return draw_samples(codes, np.linspace(0.0, 1.0, window, dtype=dtype), rng, dtype)
+
+def draw_samples(codes, ramp, rng, dtype=np.float64):
+    """(len(codes), len(ramp)) heart-rate and accelerometer samples, where
+    ramp is how far along each sample is of its scenario's trend rise."""
+    codes = np.asarray(codes, dtype=np.intp)
+    shape = (len(codes), len(ramp))
+
+    # The trend noise and the measurement noise are independent normals,
+    # so they are drawn as one normal with the combined spread.
+    hr_sigma = np.sqrt(HR_TREND_SIGMA ** 2 + HR_NOISE_SIGMA ** 2).astype(dtype)
+    heart_rate = rng.standard_normal(shape, dtype=dtype)
+    heart_rate *= hr_sigma[codes, np.newaxis]
+    heart_rate += HR_BASE.astype(dtype)[codes, np.newaxis]
+    heart_rate += HR_TREND_RISE.astype(dtype)[codes, np.newaxis] * ramp
+    np.clip(heart_rate, HR_LOW.astype(dtype)[codes, np.newaxis],
+            HR_HIGH.astype(dtype)[codes, np.newaxis], out=heart_rate)
+
+    accelerometer = rng.standard_normal(shape, dtype=dtype)
+    accelerometer *= ACC_SIGMA.astype(dtype)[codes, np.newaxis]
+    accelerometer += ACC_BASE.astype(dtype)[codes, np.newaxis]
+    np.clip(accelerometer, ACC_RANGE[0], ACC_RANGE[1], out=accelerometer)
+
+    return heart_rate, accelerometer
+
+_default_rng = np.random.default_rng()
+
+def generate_sensor_data(scenario, rng=None):
+    rng = _default_rng if rng is None else rng
+    heart_rate, accelerometer = generate_windows([scenario_code(scenario)], rng)
+    return heart_rate[0].tolist(), accelerometer[0].tolist()
+
+class SensorStream:
+    """Continuous live samples for one watch in one scenario.
+
+    Heart rate follows the scenario's trend from the moment the scenario
+    starts: the first `window` samples climb exactly as a generated
+    window does, after which the rate holds at the level the climb
+    reached. Samples are drawn one tick at a time from the stream's own
+    generator, so consecutive ticks join up instead of each repeating
+    the top of a fresh window's ramp. Pass position=window to continue
+    from a window already generated for the scenario.
+    """
+
+    def __init__(self, scenario, rng=None, window=WINDOW_SIZE, position=0):
+        self.scenario = scenario
+        self.code = scenario_code(scenario)
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.window = window
+        self.position = position
+
+    def read(self, n):
+        """The next `n` samples, e.g. one sensor tick."""
+        elapsed = np.arange(self.position, self.position + n)
+        ramp = np.minimum(elapsed / max(self.window - 1, 1), 1.0)
+        self.position += n
+        heart_rate, accelerometer = draw_samples([self.code], ramp, self.rng)
+        return heart_rate[0].tolist(), accelerometer[0].tolist()
+
+# ----------------------------------------------------------------------
+# SECTION 3: LOAD-TEST WORKLOADS
+# ----------------------------------------------------------------------
+
+CHUNK_WINDOWS = 100000
+
+def iter_workload(n_children, windows_per_child=1, probabilities=None, seed=None,
+                  window=WINDOW_SIZE, chunk_windows=CHUNK_WINDOWS, dtype=np.float64):
+    """Yield the workload in chunks of at most `chunk_windows` windows.
+
+    Windows are ordered time-major (every child's first window, then every
+    child's second, ...). Each chunk draws from its own Generator spawned
+    from `seed`, so a given (seed, chunk_windows) always reproduces the
+    same data and chunks can be produced independently.
+    """
+    total = n_children * windows_per_child
+    probabilities = np.full(len(SCENARIOS), 1.0 / len(SCENARIOS)) if probabilities is None else np.asarray(probabilities)
+    n_chunks = -(-total // chunk_windows)
+    streams = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    for chunk, stream in enumerate(streams):
+        rng = np.random.default_rng(stream)
+        start = chunk * chunk_windows
+        stop = min(start + chunk_windows, total)
+        positions = np.arange(start, stop)
+        codes = rng.choice(len(SCENARIOS), size=stop - start, p=probabilities)
+        heart_rate, accelerometer = generate_windows(codes, rng, window=window, dtype=dtype)
+        yield {
+            'child_id': positions % n_children,
+            'window_index': positions // n_children,
+            'scenario': codes.astype(np.int8),
+            'heart_rate': heart_rate,
+            'accelerometer': accelerometer
+        }
+
+def generate_workload(n_children, windows_per_child=1, probabilities=None, seed=None,
+                      window=WINDOW_SIZE, chunk_windows=CHUNK_WINDOWS, dtype=np.float64):
+    chunks = list(iter_workload(n_children, windows_per_child, probabilities, seed,
+                                window, chunk_windows, dtype))
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+WORKLOAD_COLUMNS = ['child_id', 'window_index', 'scenario', 'heart_rate', 'accelerometer']
+
+def write_workload(path, n_children, windows_per_child=1, probabilities=None, seed=None,
+                   window=WINDOW_SIZE, chunk_windows=CHUNK_WINDOWS, dtype=np.float64):
+    """Stream a workload into a directory of .npy files for later replay.
+
+    Each column is preallocated with open_memmap and filled chunk by chunk,
+    so memory stays bounded by one chunk however large the workload is.
+    """
+    os.makedirs(path, exist_ok=True)
+    total = n_children * windows_per_child
+    shapes = {
+        'child_id': ((total,), np.int64),
+        'window_index': ((total,), np.int64),
+        'scenario': ((total,), np.int8),
+        'heart_rate': ((total, window), dtype),
+        'accelerometer': ((total, window), dtype)
+    }
+    columns = {
+        name: np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode='w+', dtype=dt, shape=shape)
+        for name, (shape, dt) in shapes.items()
+    }
+
+    start = 0
+    for chunk in iter_workload(n_children, windows_per_child, probabilities, seed,
+                               window, chunk_windows, dtype):
+        stop = start + len(chunk['child_id'])
+        for name in WORKLOAD_COLUMNS:
+            columns[name][start:stop] = chunk[name]
+        start = stop
+
+    for column in columns.values():
+        column.flush()
+    return total
+
+def load_workload(path, mmap=True):
+    mmap_mode = 'r' if mmap else None
+    return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in WORKLOAD_COLUMNS}
+
+# ----------------------------------------------------------------------
+# SECTION 4: ENTRY POINT
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic SWIRI sensor workload")
+    parser.add_argument('output', help="Directory to write the .npy columns to")
+    parser.add_argument('--children', type=int, default=1000)
+    parser.add_argument('--windows', type=int, default=1000, help="Windows per child")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--mix', type=float, nargs=3, default=None, metavar=('NORMAL', 'PLAYING', 'DANGER'),
+                        help="Scenario probabilities")
+    parser.add_argument('--float32', action='store_true', help="Store samples as float32")
+    args = parser.parse_args()
+
+    probabilities = None
+    if args.mix is not None:
+        probabilities = np.asarray(args.mix) / np.sum(args.mix)
+
+    start = time.perf_counter()
+    total = write_workload(args.output, args.children, args.windows, probabilities, args.seed,
+                           dtype=np.float32 if args.float32 else np.float64)
+    seconds = time.perf_counter() - start
+    print(f"Wrote {total:,} windows to {args.output} in {seconds:.2f} s ({total / seconds:,.0f} windows/s)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
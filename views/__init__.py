@@ -0,0 +1,21 @@
+import importlib
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: PAGE REGISTRY
+# ----------------------------------------------------------------------
+
+# Menu label -> module in this package. A page's module, and whatever it
+# imports (pandas, the model, chart libraries), loads on its first visit.
+PAGES = {
+    "Home": "home",
+    "Smartwatch": "smartwatch",
+    "AI Engine": "ai_engine",
+    "Notifications": "notifications",
+    "Confirmation": "confirmation",
+    "Logs": "logs",
+    "Dashboard": "dashboard"
+}
+
+def render_page(page):
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
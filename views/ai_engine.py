@@ -0,0 +1,152 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from alerts import danger_probability
+from features import FEATURE_ORDER, compute_features, model_features
+from inference import get_prediction_label, run_pipeline
+from views.common import (get_child_states, get_hot_model, get_latency_tracker, get_watch_color, load_model, log_event,
+                          update_alert)
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: AI ENGINE PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    model = load_model()
+    latency_tracker = get_latency_tracker()
+    child_states = get_child_states()
+    
+    st.title("AI Processing Engine")
+    st.markdown("---")
+    
+    if not st.session_state.heart_rate_raw or not st.session_state.accelerometer_raw:
+        st.warning("Please generate sensor data from the Smartwatch page first.")
+    else:
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown("### Raw Sensor Data")
+            
+            df_raw = pd.DataFrame({
+                'Heart Rate': st.session_state.heart_rate_raw,
+                'Accelerometer': st.session_state.accelerometer_raw
+            })
+            
+            st.line_chart(df_raw)
+            
+            st.markdown("### Data Summary")
+            st.write(f"Heart Rate - Min: {min(st.session_state.heart_rate_raw):.1f}, "
+                    f"Max: {max(st.session_state.heart_rate_raw):.1f}, "
+                    f"Mean: {np.mean(st.session_state.heart_rate_raw):.1f}")
+            st.write(f"Accelerometer - Min: {min(st.session_state.accelerometer_raw):.2f}, "
+                    f"Max: {max(st.session_state.accelerometer_raw):.2f}, "
+                    f"Mean: {np.mean(st.session_state.accelerometer_raw):.2f}")
+        
+        with col2:
+            st.markdown("### Feature Engineering")
+            
+            features = compute_features(
+                st.session_state.heart_rate_raw,
+                st.session_state.accelerometer_raw
+            )
+            st.session_state.features = features
+            
+            st.markdown("""
+            <div class="info-card">
+                <h4>Calculated Features:</h4>
+            """, unsafe_allow_html=True)
+            
+            col_feat1, col_feat2 = st.columns(2)
+            with col_feat1:
+                st.metric("HR Mean", f"{features['hr_mean']:.2f}")
+                st.metric("HR Gradient", f"{features['hr_gradient']:.2f}")
+            with col_feat2:
+                st.metric("ACC Mean", f"{features['acc_mean']:.3f}")
+                st.metric("ACC Variance", f"{features['acc_variance']:.3f}")
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+            if model is not None:
+                version = get_hot_model().version
+                st.caption(f"Model {'shipped' if version is None else f'v{version}'} • "
+                           f"inputs: {', '.join(model_features(model))}")
+            
+            if st.button("🚀 Run AI Model", type="primary", use_container_width=True):
+                with st.spinner("Processing sensor data..."):
+                    if model is not None:
+                        model_inputs, prediction, confidence, probabilities, timings = run_pipeline(
+                            model,
+                            st.session_state.heart_rate_raw,
+                            st.session_state.accelerometer_raw,
+                            tracker=latency_tracker
+                        )
+
+                        st.session_state.features = {**features, **model_inputs}
+                        st.session_state.prediction = prediction
+                        st.session_state.confidence = confidence
+                        st.session_state.probabilities = probabilities.tolist()
+                        st.session_state.latency = timings
+                        st.session_state.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        
+                        raised = update_alert(danger_probability(model, probabilities)[0])
+                        details = f"Prediction: {get_prediction_label(prediction)}"
+                        log_event(
+                            "AI_PROCESSING", details + (" • alert raised" if raised else ""),
+                            prediction=prediction, confidence=confidence,
+                            features=[features[name] for name in FEATURE_ORDER]
+                        )
+                        child_states.update(
+                            st.session_state.child_id, prediction=prediction, confidence=confidence,
+                            hr_mean=features['hr_mean'], acc_mean=features['acc_mean'],
+                            location=st.session_state.location, alert=st.session_state.alert_triggered
+                        )
+                        
+                        st.rerun()
+        
+        if st.session_state.prediction is not None:
+            st.markdown("---")
+            st.markdown("### AI Model Results")
+            
+            col_res1, col_res2, col_res3 = st.columns(3)
+            
+            with col_res1:
+                pred_label = get_prediction_label(st.session_state.prediction)
+                pred_color = get_watch_color(st.session_state.prediction)
+                st.markdown(f"""
+                <div style="background-color: {pred_color}; padding: 20px; border-radius: 10px; text-align: center;">
+                    <h3 style="color: white; margin: 0;">{pred_label}</h3>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_res2:
+                st.markdown(f"""
+                <div class="metric-box">
+                    <h4>Confidence</h4>
+                    <p style="font-size: 2rem; font-weight: bold; color: {pred_color};">{st.session_state.confidence:.1f}%</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_res3:
+                latency = st.session_state.latency
+                processing_time = f"{latency['total_ms']:.2f} ms" if latency else "—"
+                breakdown = (f"features {latency['features_ms']:.2f} ms • model {latency['model_ms']:.2f} ms"
+                             if latency else "Run the AI model to measure")
+                percentiles = latency_tracker.percentiles()
+                rolling = (f"p50 {percentiles['p50']:.2f} • p95 {percentiles['p95']:.2f} • "
+                           f"p99 {percentiles['p99']:.2f} ms ({len(latency_tracker)} runs)"
+                           if percentiles else "No runs recorded yet")
+                st.markdown(f"""
+                <div class="metric-box">
+                    <h4>Processing Time</h4>
+                    <p style="font-size: 1.5rem; font-weight: bold;">{processing_time}</p>
+                    <p style="font-size: 0.8rem;">{breakdown}</p>
+                    <p style="font-size: 0.8rem;">{rolling}</p>
+                    <p style="font-size: 0.9rem;">{st.session_state.timestamp}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown("### Simulated GPS Location")
+            st.info(f"📍 Location: {st.session_state.location} (Lat: 37.7749° N, Long: 122.4194° W)")
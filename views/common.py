@@ -0,0 +1,141 @@
+import atexit
+
+import streamlit as st
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: SHARED RESOURCES
+# ----------------------------------------------------------------------
+
+# Each getter imports what it needs on first use, so a page that never
+# asks for the model or the journal never pays for loading them.
+
+@st.cache_resource
+def get_hot_model():
+    from registry import MODEL_REGISTRY, HotModel
+    # New versions published to the registry are loaded and warmed by a
+    # watcher thread, then swapped in without restarting the server.
+    model = HotModel(MODEL_REGISTRY).start()
+    atexit.register(model.stop)
+    return model
+
+def load_model():
+    """The current model; take it once per script run, so a run that
+    started on one version finishes on it even if a swap lands mid-way."""
+    from inference import MODEL_PATH
+    try:
+        return get_hot_model().get()
+    except:
+        st.error(f"Model file not found. Please ensure '{MODEL_PATH}' is in the current directory.")
+        return None
+
+@st.cache_resource
+def get_latency_tracker():
+    from inference import LatencyTracker
+    return LatencyTracker()
+
+@st.cache_resource
+def get_event_journal():
+    from journal import JOURNAL_DIR, EventJournal, journal_path
+    # One journal per server process, shared by every browser session;
+    # each replica writes its own file in JOURNAL_DIR.
+    journal = EventJournal(journal_path(JOURNAL_DIR))
+    atexit.register(journal.close)
+    return journal
+
+@st.cache_resource
+def get_alert_filter():
+    from alerts import DangerAlertFilter
+    # One alert state per watch, shared by every browser session.
+    return DangerAlertFilter()
+
+@st.cache_resource
+def get_notifier():
+    from notifier import LocalSink, NotificationDispatcher
+    # Delivery runs on the dispatcher's own event loop thread, so pages
+    # only hand notifications over and never wait on the fan-out.
+    notifier = NotificationDispatcher(LocalSink()).start_thread()
+    atexit.register(notifier.stop_thread)
+    return notifier
+
+@st.cache_resource
+def get_photo_store():
+    from photos import PHOTO_DIR, PhotoStore
+    photos = PhotoStore(PHOTO_DIR)
+    atexit.register(photos.close)
+    return photos
+
+@st.cache_resource
+def get_feedback_store():
+    from feedback import FEEDBACK_DIR, FeedbackStore
+    feedback = FeedbackStore(FEEDBACK_DIR)
+    atexit.register(feedback.close)
+    return feedback
+
+@st.cache_resource
+def get_child_states():
+    from child_state import ChildStateStore
+    # Shared by every browser session; each session's watch reports here.
+    return ChildStateStore()
+
+# ----------------------------------------------------------------------
+# SECTION 2: HELPER FUNCTIONS
+# ----------------------------------------------------------------------
+
+def get_watch_color(pred):
+    colors = {0: "#10B981", 1: "#F59E0B", 2: "#EF4444"}
+    return colors.get(pred, "#1E3A8A")
+
+def update_alert(danger_probability):
+    """Feed this session's latest window to the alert filter.
+
+    Sets alert_triggered from the smoothed state and returns True only
+    for the window that raised a new alert, which also needs a fresh
+    parent verdict.
+    """
+    active, raised = get_alert_filter().update([st.session_state.child_id], [danger_probability])
+    st.session_state.alert_triggered = bool(active[0])
+    if raised[0]:
+        st.session_state.parent_confirmation = None
+        st.session_state.alert_id = st.session_state.get('alert_id', 0) + 1
+    return bool(raised[0])
+
+def notify(kind, message):
+    from notifier import make_notification
+    get_notifier().submit_threadsafe(make_notification(st.session_state.child_id, kind, message))
+
+def notification_summary():
+    metrics = get_notifier().metrics()
+    latency = metrics['queue_latency_ms']
+    summary = f"{metrics['delivered']:,} notifications delivered, {metrics['queued']:,} queued"
+    if metrics['deduplicated']:
+        summary += f", {metrics['deduplicated']:,} repeat alerts suppressed"
+    if latency:
+        summary += f" • queue latency p95 {latency['p95']:.0f} ms"
+    return summary
+
+def record_feedback(parent_label):
+    """Store the parent's verdict on the current window for retraining.
+
+    At most one verdict is kept per alert: a second one for the same
+    child and alert is ignored (returns False), so retraining never sees
+    the same window twice or with opposite labels.
+    """
+    from features import compute_features
+    key = (st.session_state.child_id, st.session_state.get('alert_id', 0))
+    if st.session_state.get('feedback_key') == key:
+        return False
+    st.session_state.feedback_key = key
+    hr, acc = st.session_state.heart_rate_raw, st.session_state.accelerometer_raw
+    get_feedback_store().append(
+        st.session_state.child_id, parent_label, hr, acc,
+        features=compute_features(hr, acc) if hr and acc else None, prediction=st.session_state.prediction,
+        confidence=st.session_state.confidence, probabilities=st.session_state.probabilities
+    )
+    return True
+
+def log_event(event_type, details, prediction=None, confidence=None, features=None):
+    event = st.session_state.event_logs.log(
+        event_type, details, prediction=prediction, confidence=confidence, features=features
+    )
+    get_event_journal().append(event)
@@ -0,0 +1,76 @@
+import streamlit as st
+
+from views.common import (
+    get_alert_filter, get_photo_store, log_event, notification_summary, notify, record_feedback
+)
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: CONFIRMATION PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    st.title("Parent Confirmation")
+    st.markdown("---")
+    
+    if st.session_state.prediction is None:
+        st.warning("No alert to confirm. Please run the AI Engine first.")
+    elif st.session_state.prediction != 2 and not st.session_state.alert_triggered:
+        st.info("No emergency action required. Current status is safe.")
+    else:
+        # The alert outlives the DANGER window that raised it, so the
+        # parent can dismiss it for as long as it is active.
+        st.markdown("""
+        <div class="danger-banner" style="animation: none;">
+            🚨 EMERGENCY CONFIRMATION REQUIRED 🚨
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.captured_image:
+            thumbnail = get_photo_store().thumbnail(st.session_state.captured_image, timeout=2.0)
+            if thumbnail:
+                st.image(thumbnail, caption="Captured Emergency Photo", width=300)
+            else:
+                st.caption("📷 Emergency photo is still being processed.")
+        
+        # One verdict per alert: the buttons go once the parent has answered,
+        # and come back when a new alert is raised (see update_alert).
+        if st.session_state.parent_confirmation is None:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button("✅ CONFIRM EMERGENCY", type="primary", use_container_width=True):
+                    st.session_state.parent_confirmation = "CONFIRMED"
+                    log_event("CONFIRMATION", "Emergency confirmed by parent")
+                    record_feedback("CONFIRMED")
+                    notify("CONFIRMED", f"Emergency confirmed by parent near {st.session_state.location}")
+                    st.rerun()
+            
+            with col2:
+                if st.button("❌ FALSE ALARM", use_container_width=True):
+                    st.session_state.parent_confirmation = "FALSE_ALARM"
+                    get_alert_filter().clear(st.session_state.child_id)
+                    st.session_state.alert_triggered = False
+                    log_event("CONFIRMATION", "Marked as false alarm by parent")
+                    record_feedback("FALSE_ALARM")
+                    notify("FALSE_ALARM", "Alert cancelled: marked as a false alarm by parent")
+                    st.rerun()
+        
+        if st.session_state.parent_confirmation:
+            st.markdown("---")
+            st.markdown("### Confirmation Status")
+            if st.session_state.parent_confirmation == "CONFIRMED":
+                st.markdown("""
+                <div style="background-color: #10B981; padding: 15px; border-radius: 10px; color: white; text-align: center;">
+                    <h4>✅ Emergency Protocol Activated</h4>
+                    <p>School notified • Emergency contacts alerted • Location tracked</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div style="background-color: #F59E0B; padding: 15px; border-radius: 10px; color: white; text-align: center;">
+                    <h4>⚠️ False Alarm Registered</h4>
+                    <p>Feedback stored for model retraining • No further action required</p>
+                </div>
+                """, unsafe_allow_html=True)
+            st.caption(f"📨 {notification_summary()}")
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from child_state import ChildStatusView, child_ids, simulate_readings
+from inference import get_prediction_label
+from views.common import get_alert_filter, get_child_states, load_model
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: HELPER FUNCTIONS
+# ----------------------------------------------------------------------
+
+# Simulated fleet shown on the page.
+DASHBOARD_CHILDREN = 300
+
+def child_status_table(states):
+    return pd.DataFrame([{
+        'Child': state['child_id'],
+        'Status': get_prediction_label(state.get('prediction')),
+        'Confidence (%)': state.get('confidence'),
+        'HR Mean': state.get('hr_mean'),
+        'ACC Mean': state.get('acc_mean'),
+        'Updated': datetime.fromtimestamp(state['updated_ns'] / 1e9).strftime("%H:%M:%S")
+    } for state in states])
+
+# ----------------------------------------------------------------------
+# SECTION 2: MULTI-CHILD DASHBOARD PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    model = load_model()
+    child_states = get_child_states()
+    alert_filter = get_alert_filter()
+    if 'dashboard_view' not in st.session_state:
+        st.session_state.dashboard_view = ChildStatusView()
+    
+    st.title("Multi-Child Dashboard")
+    st.markdown("---")
+    
+    col_sim, col_refresh = st.columns([3, 1])
+    
+    with col_sim:
+        changed_per_tick = st.slider("Children reporting per simulated tick", 1, DASHBOARD_CHILDREN, 25,
+                                     key="dashboard_tick_size")
+        if st.button("📡 Simulate Readings", use_container_width=True) and model is not None:
+            fleet = child_ids(DASHBOARD_CHILDREN)
+            # The first tick brings the whole fleet online.
+            if len(child_states) < DASHBOARD_CHILDREN:
+                reporting = fleet
+            else:
+                picks = np.random.choice(DASHBOARD_CHILDREN, size=changed_per_tick, replace=False)
+                reporting = [fleet[i] for i in picks]
+            simulate_readings(child_states, model, reporting, probabilities=[0.6, 0.3, 0.1], alerts=alert_filter)
+    
+    with col_refresh:
+        st.button("🔄 Refresh", use_container_width=True)
+    
+    # Only children updated since this session's last refresh are merged.
+    view = st.session_state.dashboard_view
+    changed = view.refresh(child_states)
+    
+    if not view.states:
+        st.info("No children are reporting yet. Simulate readings or run the AI model on a watch.")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Children Monitored", len(view.states))
+        with col2:
+            st.metric("Normal", int(view.label_counts[0]))
+        with col3:
+            st.metric("Playing", int(view.label_counts[1]))
+        with col4:
+            st.metric("Danger", int(view.label_counts[2]))
+        
+        st.markdown(f"### 🚨 Active Danger Alerts ({len(view.danger)})")
+        alert_stats = alert_filter.stats()
+        st.caption(f"{alert_stats['alerts_raised']:,} alerts raised over {alert_stats['windows']:,} scored windows; "
+                   "an alert clears only once a child's smoothed DANGER probability falls back.")
+        if view.danger:
+            st.dataframe(child_status_table(view.states[child_id] for child_id in sorted(view.danger)),
+                         hide_index=True, use_container_width=True)
+        else:
+            st.success("No child is currently in danger.")
+        
+        st.markdown(f"### Updated Since Last Refresh ({len(changed)})")
+        if changed:
+            st.dataframe(child_status_table(reversed(changed[-100:])), hide_index=True, use_container_width=True)
+        else:
+            st.caption("No changes.")
+        
+        if st.checkbox("Show all children", key="dashboard_show_all"):
+            st.dataframe(child_status_table(view.states.values()), hide_index=True, use_container_width=True)
+        
+        st.caption(f"Store version {view.version:,} • your watch reports as {st.session_state.child_id}")
@@ -0,0 +1,69 @@
+import streamlit as st
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: HOME PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    st.title("SWIRI AI Safety System")
+    st.markdown("---")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        <div class="info-card">
+            <h3>System Overview</h3>
+            <p style="font-size: 1.1rem; line-height: 1.6;">
+                SWIRI is an intelligent child safety monitoring system that uses wearable sensor data 
+                and machine learning to detect potential dangerous situations in real-time. The system 
+                continuously monitors heart rate and movement patterns to classify child activities 
+                into three categories: Normal, Playing, or Danger.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("### System Architecture")
+        st.code("""
+┌─────────────┐    ┌─────────────┐    ┌─────────────────┐
+│  Wearable   │───▶│   Sensor    │───▶│    Feature      │
+│   Device    │    │    Data     │    │  Engineering    │
+└─────────────┘    └─────────────┘    └─────────────────┘
+                                              │
+                                              ▼
+┌─────────────┐    ┌─────────────┐    ┌─────────────────┐
+│   Parent    │◀───│    Alert    │◀───│   AI Model      │
+│ Confirmation│    │   System    │    │  Classification │
+└─────────────┘    └─────────────┘    └─────────────────┘
+      │                   ▲
+      ▼                   │
+┌─────────────┐    ┌─────────────┐
+│  Feedback   │────│   School    │
+│    Loop     │    │ Notification│
+└─────────────┘    └─────────────┘
+        """)
+    
+    with col2:
+        st.markdown("### Technical Specs")
+        st.markdown("""
+        <div class="metric-box">
+            <h4>Sensor Sampling Rate</h4>
+            <p style="font-size: 2rem; font-weight: bold; color: #1E3A8A;">10 Hz</p>
+        </div>
+        <br>
+        <div class="metric-box">
+            <h4>Window Size</h4>
+            <p style="font-size: 2rem; font-weight: bold; color: #1E3A8A;">5 seconds</p>
+        </div>
+        <br>
+        <div class="metric-box">
+            <h4>Samples per Window</h4>
+            <p style="font-size: 2rem; font-weight: bold; color: #1E3A8A;">50</p>
+        </div>
+        <br>
+        <div class="metric-box">
+            <h4>Model Type</h4>
+            <p style="font-size: 2rem; font-weight: bold; color: #1E3A8A;">Random Forest</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,96 @@
+import streamlit as st
+
+from event_analytics import confidence_distribution, danger_alerts_per_hour
+from events import EVENT_TYPES
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: LOGS PAGE
+# ----------------------------------------------------------------------
+
+LOG_PAGE_SIZES = [25, 50, 100]
+
+def render():
+    st.title("System Event Logs")
+    st.markdown("---")
+    
+    if not st.session_state.event_logs:
+        st.info("No events logged yet. Start using the system to generate logs.")
+    else:
+        # Only one page of events is fetched and rendered per rerun, so
+        # render cost stays flat however many events are stored.
+        col_filter, col_size, col_page = st.columns([2, 1, 1])
+        
+        with col_filter:
+            type_filter = st.selectbox("Event type", ["All"] + EVENT_TYPES, key="log_type_filter")
+        with col_size:
+            page_size = st.selectbox("Events per page", LOG_PAGE_SIZES, key="log_page_size")
+        
+        event_type = None if type_filter == "All" else type_filter
+        matching = st.session_state.event_logs.count(event_type)
+        page_count = max(1, -(-matching // page_size))
+        
+        with col_page:
+            page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="log_page")
+        
+        page_events = st.session_state.event_logs.latest(
+            event_type, offset=(page_number - 1) * page_size, limit=page_size
+        )
+        
+        if not page_events:
+            st.info(f"No {type_filter} events logged yet.")
+        else:
+            rows = []
+            for log in page_events:
+                color = {
+                    "SCENARIO": "#1E3A8A",
+                    "AI_PROCESSING": "#059669",
+                    "CAMERA": "#7C3AED",
+                    "CONFIRMATION": "#D97706"
+                }.get(log['type'], "#6B7280")
+                
+                rows.append(f"""
+                <div style="background-color: #F9FAFB; padding: 10px; margin: 5px 0; border-radius: 5px; border-left: 4px solid {color};">
+                    <strong>[{log['timestamp']}]</strong> {log['type']}: {log['details']}
+                </div>
+                """)
+            
+            st.markdown("".join(rows), unsafe_allow_html=True)
+            st.caption(f"Page {page_number} of {page_count} • {matching:,} matching events")
+        
+        st.markdown("---")
+        st.markdown("### System Statistics")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Events", st.session_state.event_logs.count())
+        with col2:
+            st.metric("Scenarios Run", st.session_state.event_logs.count("SCENARIO"))
+        with col3:
+            st.metric("Danger Alerts", st.session_state.event_logs.danger_count)
+        with col4:
+            st.metric("Confirmations", st.session_state.event_logs.count("CONFIRMATION"))
+        
+        columns = st.session_state.event_logs.columns()
+        if len(columns['ts_ns']):
+            with st.expander("Prediction Analytics"):
+                col_hourly, col_confidence = st.columns(2)
+                with col_hourly:
+                    st.markdown("**Danger alerts per hour (UTC)**")
+                    hourly = danger_alerts_per_hour(columns)
+                    if len(hourly):
+                        st.bar_chart(hourly, height=200)
+                    else:
+                        st.caption("No danger alerts recorded.")
+                with col_confidence:
+                    st.markdown("**Confidence distribution by prediction**")
+                    st.bar_chart(confidence_distribution(columns), height=200)
+        
+        if st.session_state.event_logs.evicted:
+            st.caption(f"Showing the latest {st.session_state.event_logs.capacity:,} events; "
+                       f"{st.session_state.event_logs.evicted:,} older events were dropped.")
+        
+        if st.button("🗑️ Clear All Logs"):
+            st.session_state.event_logs.clear()
+            st.rerun()
@@ -0,0 +1,92 @@
+import streamlit as st
+
+from photos import photo_id
+from alerts import ALERT_ENTER
+from views.common import get_alert_filter, get_photo_store, log_event, notify
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: NOTIFICATIONS PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    st.title("Parent Notification System")
+    st.markdown("---")
+    
+    if st.session_state.prediction is None:
+        st.warning("No prediction available. Please run the AI Engine first.")
+    else:
+        if st.session_state.alert_triggered and st.session_state.prediction != 2:
+            st.info("🚨 An alert is still active for this watch; it clears once readings stay calm.")
+        
+        if st.session_state.prediction == 0:
+            st.markdown("""
+            <div class="safe-banner">
+                ✅ Child Status: SAFE - Normal Activity Detected
+            </div>
+            """, unsafe_allow_html=True)
+            if not st.session_state.alert_triggered:
+                st.balloons()
+        
+        elif st.session_state.prediction == 1:
+            st.markdown("""
+            <div class="warning-banner">
+                ⚡ Child Status: High Physical Activity - Playing
+            </div>
+            """, unsafe_allow_html=True)
+        
+        elif not st.session_state.alert_triggered:
+            # A DANGER window the alert filter has not confirmed yet: no
+            # alarm until the following readings back it up.
+            st.markdown("""
+            <div class="warning-banner">
+                ⚠️ Possible Danger - Confirming With The Next Readings
+            </div>
+            """, unsafe_allow_html=True)
+            if st.session_state.parent_confirmation == "FALSE_ALARM":
+                st.info("A parent marked this alert as a false alarm; the alarm sounds again only if new readings "
+                        "confirm the danger.")
+            else:
+                score = get_alert_filter().danger_score(st.session_state.child_id) or 0.0
+                st.info(f"Smoothed danger probability is {score:.0%}; the alarm sounds once recent readings "
+                        f"reach {ALERT_ENTER:.0%}.")
+        
+        else:
+            st.markdown("""
+            <div class="danger-banner">
+                🚨 HIGH RISK DETECTED - Immediate Attention Required 🚨
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.error("🔊 ALARM: Emergency Situation Detected!")
+            # Repeats for the same child are deduplicated by the dispatcher,
+            # so reruns of this page do not notify anyone twice.
+            notify("DANGER", f"High risk detected for your child near {st.session_state.location}")
+            st.caption("📨 Parent, school and emergency contacts are being notified.")
+            
+            col1, col2 = st.columns(2)
+            # Scenario buttons set a prediction without running the model.
+            confidence = st.session_state.confidence
+            confidence = "—" if confidence is None else f"{confidence:.1f}%"
+            
+            with col1:
+                st.markdown("### Alert Details")
+                st.markdown(f"""
+                - **Heart Rate:** {st.session_state.features.get('hr_mean', 0):.1f} BPM
+                - **Location:** {st.session_state.location}
+                - **Confidence:** {confidence}
+                - **Timestamp:** {st.session_state.timestamp}
+                - **Accelerometer Variance:** {st.session_state.features.get('acc_variance', 0):.3f}
+                """)
+            
+            with col2:
+                st.markdown("### Emergency Camera Feed")
+                img_file = st.camera_input("Capture emergency photo", key="emergency_cam")
+                
+                if img_file is not None:
+                    # The capture goes to disk once; the session keeps only its id.
+                    captured = photo_id(st.session_state.child_id, img_file.file_id)
+                    if get_photo_store().save(img_file, captured):
+                        log_event("CAMERA", "Emergency photo captured")
+                    st.session_state.captured_image = captured
+                    st.success("📸 Emergency photo saved for parent confirmation.")
@@ -0,0 +1,573 @@
+from functools import lru_cache
+
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+from features import SAMPLE_RATE_HZ, WINDOW_SIZE, StreamingFeatureExtractor
+from inference import get_prediction_label
+from sensors import SensorStream, generate_sensor_data
+from views.common import get_watch_color, log_event, update_alert
+
+
+# ----------------------------------------------------------------------
+# SECTION 1: CHILD ILLUSTRATION AND LIVE VITALS
+# ----------------------------------------------------------------------
+
+# Live vitals: new samples arrive every tick at the sensor rate and only
+# the vitals fragment reruns, not the whole script.
+SENSOR_TICK_SECONDS = 1.0
+SAMPLES_PER_TICK = round(SAMPLE_RATE_HZ * SENSOR_TICK_SECONDS)
+
+@lru_cache(maxsize=None)
+def child_scene_html(scene, watch_color):
+    # Only scene and watch_color vary, so each combination is built once
+    # per process. Indentation is stripped, which cuts about 7 KB (~30%)
+    # from what every full rerun sends; lru_cache rather than
+    # st.cache_resource, whose lookup costs more than the build itself.
+    html = f"""
+    <div style="position: relative; width: 100%; background: linear-gradient(135deg, #87CEEB 0%, #98D8E8 100%); border-radius: 20px; padding: 30px 20px; border: 4px solid #1E3A8A; margin-bottom: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.2);">
+        
+        <!-- Background scene changes based on scenario -->
+        <div style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; overflow: hidden; border-radius: 16px;">
+            <!-- Sky with sun or clouds based on scenario -->
+            <div style="position: absolute; top: 0; left: 0; width: 100%; height: 70%; 
+                        background: {'linear-gradient(to bottom, #87CEEB, #B0E0E6)' if scene == 'NORMAL' else 'linear-gradient(to bottom, #FFD700, #87CEEB)' if scene == 'PLAYING' else 'linear-gradient(to bottom, #2C3E50, #34495E)'};">
+            </div>
+            
+            <!-- Sun or moon based on scenario -->
+            <div style="position: absolute; top: 20px; right: 20px; width: 60px; height: 60px; 
+                        background: {'#FFD700' if scene != 'DANGER' else '#95A5A6'}; 
+                        border-radius: 50%; 
+                        box-shadow: {'0 0 30px #FFD700' if scene != 'DANGER' else '0 0 30px #95A5A6'};
+                        animation: {'sunRotate 10s linear infinite' if scene == 'PLAYING' else 'none'};">
+            </div>
+            
+            <!-- Clouds (only in normal and playing) -->
+            {'<div style="position: absolute; top: 50px; left: 30px; width: 80px; height: 30px; background: white; border-radius: 30px; opacity: 0.8; animation: cloudMove 15s linear infinite;"></div>' if scene != 'DANGER' else ''}
+            {'<div style="position: absolute; top: 80px; left: 150px; width: 100px; height: 35px; background: white; border-radius: 35px; opacity: 0.6; animation: cloudMove 20s linear infinite;"></div>' if scene != 'DANGER' else ''}
+            
+            <!-- Ground -->
+            <div style="position: absolute; bottom: 0; left: 0; width: 100%; height: 30%; 
+                        background: {'linear-gradient(to top, #2ecc71, #27ae60)' if scene != 'DANGER' else 'linear-gradient(to top, #7f8c8d, #95a5a6)'};
+                        border-top: 3px solid #1E3A8A;">
+                
+                <!-- Grass details -->
+                {'<div style="position: absolute; top: -10px; left: 10px; width: 5px; height: 15px; background: #27ae60; transform: rotate(10deg);"></div>' * 20 if scene != 'DANGER' else ''}
+            </div>
+        </div>
+        
+        <!-- Main character container -->
+        <div style="position: relative; width: 400px; height: 500px; margin: 0 auto;" class="child-container">
+            
+            <!-- SCENE 1: NORMAL (Standing calmly, green watch) -->
+            <div style="position: relative; display: {'block' if scene == 'NORMAL' else 'none'};">
+                <!-- Child standing normally -->
+                <div class="child-standing">
+                    <!-- Head -->
+                    <div style="position: absolute; top: 20px; left: 150px; width: 90px; height: 90px; 
+                                background: radial-gradient(circle at 30% 30%, #FFE4B5, #DEB887); 
+                                border-radius: 50%; border: 3px solid #1E3A8A;
+                                box-shadow: 0 8px 15px rgba(0,0,0,0.2);">
+                        <!-- Happy face -->
+                        <div style="position: absolute; top: 50px; left: 55px; width: 30px; height: 15px; 
+                                    border-bottom: 4px solid #1E3A8A; border-radius: 0 0 30px 30px;"></div>
+                        <div style="position: absolute; top: 30px; left: 45px; width: 8px; height: 8px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                        <div style="position: absolute; top: 30px; left: 75px; width: 8px; height: 8px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                    </div>
+                    
+                    <!-- Body -->
+                    <div style="position: absolute; top: 105px; left: 165px; width: 60px; height: 100px; 
+                                background: #3498db; border-radius: 15px; border: 3px solid #1E3A8A;">
+                    </div>
+                    
+                    <!-- Arms down -->
+                    <div style="position: absolute; top: 120px; left: 125px; width: 45px; height: 20px; 
+                                background: #3498db; border-radius: 20px; transform: rotate(-10deg); border: 3px solid #1E3A8A;"></div>
+                    <div style="position: absolute; top: 120px; left: 215px; width: 45px; height: 20px; 
+                                background: #3498db; border-radius: 20px; transform: rotate(10deg); border: 3px solid #1E3A8A;"></div>
+                    
+                    <!-- Green Watch -->
+                    <div style="position: absolute; top: 115px; left: 245px; width: 35px; height: 35px; 
+                                background: #10B981; border-radius: 10px; border: 3px solid #1E3A8A;
+                                box-shadow: 0 0 20px #10B981; animation: watchPulse 2s infinite;">
+                        <div style="position: absolute; top: 8px; left: 8px; width: 15px; height: 15px; 
+                                    background: white; border-radius: 5px;"></div>
+                    </div>
+                    
+                    <!-- Legs -->
+                    <div style="position: absolute; top: 200px; left: 175px; width: 20px; height: 70px; 
+                                background: #2c3e50; border-radius: 10px; border: 3px solid #1E3A8A;"></div>
+                    <div style="position: absolute; top: 200px; left: 195px; width: 20px; height: 70px; 
+                                background: #2c3e50; border-radius: 10px; border: 3px solid #1E3A8A;"></div>
+                </div>
+                
+                <!-- Status text -->
+                <div style="position: absolute; top: 350px; left: 150px; background: #10B981; 
+                            padding: 10px 20px; border-radius: 20px; color: white; font-weight: bold;
+                            border: 2px solid #1E3A8A;">
+                    NORMAL - Safe & Calm 🏠
+                </div>
+            </div>
+            
+            <!-- SCENE 2: PLAYING (Running with football, yellow watch) -->
+            <div style="position: relative; display: {'block' if scene == 'PLAYING' else 'none'};">
+                <!-- Child running with football -->
+                <div class="child-playing">
+                    <!-- Head (excited expression) -->
+                    <div style="position: absolute; top: 20px; left: 150px; width: 90px; height: 90px; 
+                                background: radial-gradient(circle at 30% 30%, #FFE4B5, #DEB887); 
+                                border-radius: 50%; border: 3px solid #1E3A8A;
+                                animation: headBob 0.5s infinite;">
+                        <!-- Excited face (open mouth) -->
+                        <div style="position: absolute; top: 50px; left: 55px; width: 20px; height: 20px; 
+                                    background: #FF6B6B; border-radius: 50%; border: 2px solid #1E3A8A;"></div>
+                        <div style="position: absolute; top: 30px; left: 45px; width: 10px; height: 10px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                        <div style="position: absolute; top: 30px; left: 75px; width: 10px; height: 10px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                        <!-- Sweat -->
+                        <div style="position: absolute; top: 20px; left: 80px; width: 5px; height: 10px; 
+                                    background: #87CEEB; border-radius: 5px; transform: rotate(20deg);"></div>
+                    </div>
+                    
+                    <!-- Body leaning forward -->
+                    <div style="position: absolute; top: 105px; left: 165px; width: 60px; height: 90px; 
+                                background: #e74c3c; border-radius: 15px; border: 3px solid #1E3A8A;
+                                transform: rotate(5deg);">
+                        <!-- Number on shirt -->
+                        <div style="position: absolute; top: 30px; left: 20px; color: white; 
+                                    font-weight: bold; font-size: 20px;">10</div>
+                    </div>
+                    
+                    <!-- Arms running -->
+                    <div style="position: absolute; top: 115px; left: 120px; width: 50px; height: 20px; 
+                                background: #e74c3c; border-radius: 20px; transform: rotate(-45deg); 
+                                border: 3px solid #1E3A8A; animation: armRunLeft 0.5s infinite;"></div>
+                    <div style="position: absolute; top: 115px; left: 215px; width: 50px; height: 20px; 
+                                background: #e74c3c; border-radius: 20px; transform: rotate(45deg); 
+                                border: 3px solid #1E3A8A; animation: armRunRight 0.5s infinite;"></div>
+                    
+                    <!-- Yellow Watch -->
+                    <div style="position: absolute; top: 110px; left: 250px; width: 35px; height: 35px; 
+                                background: #F59E0B; border-radius: 10px; border: 3px solid #1E3A8A;
+                                box-shadow: 0 0 20px #F59E0B; animation: watchGlow 0.5s infinite;">
+                        <div style="position: absolute; top: 8px; left: 8px; color: white; 
+                                    font-size: 12px; font-weight: bold;">⚽</div>
+                    </div>
+                    
+                    <!-- Legs running -->
+                    <div style="position: absolute; top: 190px; left: 175px; width: 20px; height: 80px; 
+                                background: #2c3e50; border-radius: 10px; border: 3px solid #1E3A8A;
+                                transform: rotate(15deg); animation: legRun 0.5s infinite;"></div>
+                    <div style="position: absolute; top: 190px; left: 195px; width: 20px; height: 80px; 
+                                background: #2c3e50; border-radius: 10px; border: 3px solid #1E3A8A;
+                                transform: rotate(-15deg); animation: legRun 0.5s infinite reverse;"></div>
+                    
+                    <!-- Football -->
+                    <div style="position: absolute; top: 200px; left: 230px; width: 30px; height: 30px; 
+                                background: #8B4513; border-radius: 50%; border: 3px solid #1E3A8A;
+                                animation: ballRoll 0.3s infinite;">
+                        <div style="position: absolute; top: 5px; left: 5px; width: 20px; height: 20px; 
+                                    border: 2px solid black; border-radius: 50%;"></div>
+                    </div>
+                    
+                    <!-- Dust particles -->
+                    <div style="position: absolute; top: 220px; left: 150px; width: 5px; height: 5px; 
+                                background: #95a5a6; border-radius: 50%; animation: dust 0.5s infinite;"></div>
+                    <div style="position: absolute; top: 225px; left: 160px; width: 8px; height: 8px; 
+                                background: #95a5a6; border-radius: 50%; animation: dust 0.7s infinite;"></div>
+                </div>
+                
+                <!-- Status text -->
+                <div style="position: absolute; top: 350px; left: 150px; background: #F59E0B; 
+                            padding: 10px 20px; border-radius: 20px; color: white; font-weight: bold;
+                            border: 2px solid #1E3A8A;">
+                    PLAYING - Running & Playing ⚽
+                </div>
+            </div>
+            
+      
+            <div style="position: relative; display: {'block' if scene == 'DANGER' else 'none'};">
+                <!-- Child being grabbed -->
+                <div class="child-danger">
+                    <!-- Child with scared expression -->
+                    <div style="position: absolute; top: 20px; left: 120px; width: 90px; height: 90px; 
+                                background: radial-gradient(circle at 30% 30%, #FFE4B5, #DEB887); 
+                                border-radius: 50%; border: 3px solid #1E3A8A;
+                                animation: shake 0.1s infinite;">
+                        <!-- Scared face -->
+                        <div style="position: absolute; top: 35px; left: 40px; width: 15px; height: 15px; 
+                                    background: white; border-radius: 50%; border: 3px solid #1E3A8A;"></div>
+                        <div style="position: absolute; top: 35px; left: 70px; width: 15px; height: 15px; 
+                                    background: white; border-radius: 50%; border: 3px solid #1E3A8A;"></div>
+                        <div style="position: absolute; top: 40px; left: 45px; width: 5px; height: 5px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                        <div style="position: absolute; top: 40px; left: 75px; width: 5px; height: 5px; 
+                                    background: #1E3A8A; border-radius: 50%;"></div>
+                        <!-- Open mouth screaming -->
+                        <div style="position: absolute; top: 60px; left: 55px; width: 20px; height: 20px; 
+                                    background: #EF4444; border-radius: 50%; border: 2px solid #1E3A8A;"></div>
+                        <!-- Tears -->
+                        <div style="position: absolute; top: 45px; left: 35px; width: 5px; height: 10px; 
+                                    background: #87CEEB; border-radius: 5px; animation: tearDrop 0.5s infinite;"></div>
+                    </div>
+                    
+                    <!-- Child's body (leaning back in fear) -->
+                    <div style="position: absolute; top: 105px; left: 135px; width: 60px; height: 90px; 
+                                background: #3498db; border-radius: 15px; border: 3px solid #1E3A8A;
+                                transform: rotate(-10deg);">
+                    </div>
+                    
+                    <!-- Child's arms (trying to resist) -->
+                    <div style="position: absolute; top: 115px; left: 95px; width: 45px; height: 20px; 
+                                background: #3498db; border-radius: 20px; transform: rotate(30deg); 
+                                border: 3px solid #1E3A8A; animation: struggle 0.2s infinite;"></div>
+                    <div style="position: absolute; top: 115px; left: 185px; width: 45px; height: 20px; 
+                                background: #3498db; border-radius: 20px; transform: rotate(-20deg); 
+                                border: 3px solid #1E3A8A; animation: struggle 0.2s infinite reverse;"></div>
+                    
+                    <!-- Red Watch (flashing) -->
+                    <div style="position: absolute; top: 110px; left: 215px; width: 40px; height: 40px; 
+                                background: #EF4444; border-radius: 10px; border: 3px solid #1E3A8A;
+                                box-shadow: 0 0 30px #EF4444; animation: dangerFlash 0.1s infinite;">
+                        <div style="position: absolute; top: 5px; left: 5px; color: white; 
+                                    font-size: 20px; font-weight: bold; animation: pulse 0.1s infinite;">SOS</div>
+                    </div>
+                    
+           
+                    <!-- Kidnapper's body -->
+                    <div style="position: absolute; top: 90px; left: 190px; width: 80px; height: 120px; 
+                                background: #2C3E50; border-radius: 20px; border: 4px solid #1E3A8A;
+                                transform: rotate(5deg);">
+                        <!-- "KIDNAPPER" text on shirt -->
+                        <div style="position: absolute; top: 40px; left: 10px; color: #EF4444; 
+                                    font-weight: bold; font-size: 12px; transform: rotate(-5deg);">???</div>
+                    </div>
+                    
+                    <!-- Kidnapper's head (scary) -->
+                    <div style="position: absolute; top: 20px; left: 210px; width: 80px; height: 80px; 
+                                background: #4A5568; border-radius: 50%; border: 4px solid #1E3A8A;
+                                filter: drop-shadow(0 0 10px #EF4444);">
+                        <!-- Scary mask -->
+                        <div style="position: absolute; top: 20px; left: 15px; width: 20px; height: 10px; 
+                                    background: #EF4444; border-radius: 10px;"></div>
+                        <div style="position: absolute; top: 20px; left: 45px; width: 20px; height: 10px; 
+                                    background: #EF4444; border-radius: 10px;"></div>
+                        <div style="position: absolute; top: 40px; left: 25px; width: 30px; height: 20px; 
+                                    background: #1E3A8A; border-radius: 10px;"></div>
+                        <!-- Menacing eyes -->
+                        <div style="position: absolute; top: 25px; left: 25px; width: 5px; height: 5px; 
+                                    background: #EF4444; border-radius: 50%; animation: glow 0.1s infinite;"></div>
+                        <div style="position: absolute; top: 25px; left: 50px; width: 5px; height: 5px; 
+                                    background: #EF4444; border-radius: 50%; animation: glow 0.1s infinite;"></div>
+                    </div>
+                    
+                    <!-- Kidnapper's arm grabbing child -->
+                    <div style="position: absolute; top: 110px; left: 165px; width: 60px; height: 25px; 
+                                background: #4A5568; border-radius: 30px; transform: rotate(-20deg); 
+                                border: 4px solid #1E3A8A; box-shadow: 0 0 15px #EF4444;">
+                        <!-- Hand grabbing -->
+                        <div style="position: absolute; top: -5px; left: -10px; width: 25px; height: 30px; 
+                                    background: #4A5568; border-radius: 50% 50% 30% 30%; 
+                                    border: 4px solid #1E3A8A;"></div>
+                    </div>
+                    
+                    <!-- Kidnapper's other arm -->
+                    <div style="position: absolute; top: 120px; left: 260px; width: 50px; height: 25px; 
+                                background: #4A5568; border-radius: 30px; transform: rotate(30deg); 
+                                border: 4px solid #1E3A8A;"></div>
+                    
+                    <!-- Kidnapper's legs (running stance) -->
+                    <div style="position: absolute; top: 205px; left: 210px; width: 25px; height: 80px; 
+                                background: #2C3E50; border-radius: 10px; border: 4px solid #1E3A8A;
+                                transform: rotate(10deg); animation: kidnapperRun 0.3s infinite;"></div>
+                    <div style="position: absolute; top: 205px; left: 235px; width: 25px; height: 80px; 
+                                background: #2C3E50; border-radius: 10px; border: 4px solid #1E3A8A;
+                                transform: rotate(-10deg); animation: kidnapperRun 0.3s infinite reverse;"></div>
+                    
+                    <!-- Danger symbols -->
+                    <div style="position: absolute; top: 10px; left: 50px; color: #EF4444; 
+                                font-size: 30px; font-weight: bold; animation: dangerSign 0.2s infinite;">⚠️</div>
+                    <div style="position: absolute; top: 300px; left: 100px; color: #EF4444; 
+                                font-size: 20px; animation: dangerSign 0.3s infinite;">🚨</div>
+                </div>
+                
+                <!-- Status text with alarm -->
+                <div style="position: absolute; top: 350px; left: 120px; background: #EF4444; 
+                            padding: 15px 25px; border-radius: 30px; color: white; font-weight: bold;
+                            border: 3px solid #1E3A8A; animation: alarmPulse 0.1s infinite;
+                            font-size: 1.2rem;">
+                    🚨 DANGER - KIDNAPPING ATTEMPT! 🚨
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <style>
+        /* Scene 2 animations (playing) */
+        @keyframes armRunLeft {{
+            0%, 100% {{ transform: rotate(-45deg); }}
+            50% {{ transform: rotate(-60deg); }}
+        }}
+        
+        @keyframes armRunRight {{
+            0%, 100% {{ transform: rotate(45deg); }}
+            50% {{ transform: rotate(60deg); }}
+        }}
+        
+        @keyframes legRun {{
+            0%, 100% {{ transform: rotate(15deg) translateY(0); }}
+            50% {{ transform: rotate(25deg) translateY(-5px); }}
+        }}
+        
+        @keyframes headBob {{
+            0%, 100% {{ transform: translateY(0); }}
+            50% {{ transform: translateY(-5px); }}
+        }}
+        
+        @keyframes ballRoll {{
+            0% {{ transform: rotate(0deg); }}
+            100% {{ transform: rotate(360deg); }}
+        }}
+        
+        @keyframes dust {{
+            0% {{ opacity: 1; transform: scale(1); }}
+            100% {{ opacity: 0; transform: scale(2) translateX(20px); }}
+        }}
+        
+        /* Scene 3 animations (danger) */
+        @keyframes shake {{
+            0%, 100% {{ transform: translateX(0); }}
+            25% {{ transform: translateX(-5px); }}
+            75% {{ transform: translateX(5px); }}
+        }}
+        
+        @keyframes struggle {{
+            0%, 100% {{ transform: rotate(30deg); }}
+            50% {{ transform: rotate(45deg); }}
+        }}
+        
+        @keyframes dangerFlash {{
+            0%, 100% {{ background: #EF4444; box-shadow: 0 0 30px #EF4444; }}
+            50% {{ background: #FF6B6B; box-shadow: 0 0 50px #FF0000; }}
+        }}
+        
+        @keyframes alarmPulse {{
+            0%, 100% {{ transform: scale(1); background: #EF4444; }}
+            50% {{ transform: scale(1.1); background: #FF0000; }}
+        }}
+        
+        @keyframes tearDrop {{
+            0% {{ transform: translateY(0); opacity: 1; }}
+            100% {{ transform: translateY(20px); opacity: 0; }}
+        }}
+        
+        @keyframes glow {{
+            0%, 100% {{ box-shadow: 0 0 5px #EF4444; }}
+            50% {{ box-shadow: 0 0 20px #EF4444; }}
+        }}
+        
+        @keyframes kidnapperRun {{
+            0%, 100% {{ transform: rotate(10deg) translateY(0); }}
+            50% {{ transform: rotate(15deg) translateY(-5px); }}
+        }}
+        
+        @keyframes dangerSign {{
+            0%, 100% {{ opacity: 1; transform: scale(1); }}
+            50% {{ opacity: 0.5; transform: scale(1.5); }}
+        }}
+        
+        @keyframes sunRotate {{
+            0% {{ transform: rotate(0deg); }}
+            100% {{ transform: rotate(360deg); }}
+        }}
+        
+        @keyframes cloudMove {{
+            0% {{ transform: translateX(-100px); }}
+            100% {{ transform: translateX(400px); }}
+        }}
+        
+        .child-container {{
+            animation: float 3s ease-in-out infinite;
+        }}
+    </style>
+    """
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+def sparkline_chart(name, values):
+    # A fixed Vega-Lite spec instead of st.line_chart, which rebuilds and
+    # schema-validates an Altair chart (~100 ms) on every call.
+    st.vega_lite_chart(pd.DataFrame({'sample': range(len(values)), 'value': values}), {
+        'mark': {'type': 'line'},
+        'encoding': {
+            'x': {'field': 'sample', 'type': 'quantitative', 'title': None},
+            'y': {'field': 'value', 'type': 'quantitative', 'title': name, 'scale': {'zero': False}}
+        }
+    }, height=150, use_container_width=True)
+
+def live_vitals_panel():
+    # Runs as a fragment: on each tick only this function reruns, with the
+    # newest samples rolled into the session's sensor window and its
+    # window features updated per sample rather than recomputed.
+    extractor = st.session_state.get('feature_stream')
+    if extractor is None:
+        extractor = st.session_state.feature_stream = StreamingFeatureExtractor(WINDOW_SIZE)
+        extractor.extend(st.session_state.heart_rate_raw, st.session_state.accelerometer_raw)
+    if st.session_state.live_stream and st.session_state.scenario in ("NORMAL", "PLAYING", "DANGER"):
+        stream = st.session_state.get('sensor_stream')
+        if stream is None or stream.scenario != st.session_state.scenario:
+            # The scenario button already generated the first window.
+            stream = st.session_state.sensor_stream = SensorStream(st.session_state.scenario, position=WINDOW_SIZE)
+        hr, acc = stream.read(SAMPLES_PER_TICK)
+        st.session_state.heart_rate_raw = (st.session_state.heart_rate_raw + hr)[-WINDOW_SIZE:]
+        st.session_state.accelerometer_raw = (st.session_state.accelerometer_raw + acc)[-WINDOW_SIZE:]
+        extractor.extend(hr, acc)
+    window = extractor.features()
+    
+    st.markdown("### 📊 Real-time Vital Signs")
+    
+    # Vital signs card
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, {get_watch_color(st.session_state.prediction) if st.session_state.prediction is not None else '#667eea'} 0%, #764ba2 100%); 
+                padding: 20px; border-radius: 15px; color: white; margin-bottom: 20px;
+                animation: {'pulse 0.5s infinite' if st.session_state.prediction == 2 else 'none'};">
+    """, unsafe_allow_html=True)
+    
+    col_metric1, col_metric2 = st.columns(2)
+    
+    with col_metric1:
+        current_hr = st.session_state.heart_rate_raw[-1] if st.session_state.heart_rate_raw else 0
+        avg_hr = window['hr_mean']
+        st.metric("Heart Rate (BPM)", f"{current_hr:.0f}", f"{avg_hr:.0f} avg")
+    
+    with col_metric2:
+        current_acc = st.session_state.accelerometer_raw[-1] if st.session_state.accelerometer_raw else 0
+        avg_acc = window['acc_mean']
+        st.metric("Accelerometer (g)", f"{current_acc:.2f}", f"{avg_acc:.2f} avg")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    st.caption(f"Last {extractor.count / SAMPLE_RATE_HZ:.0f} s: heart rate {window['hr_gradient']:+.1f} BPM • "
+               f"movement variance {window['acc_variance']:.3f}")
+    
+    # Sensor data visualization
+    st.markdown("### 📈 Sensor Data Stream")
+    
+    col_chart1, col_chart2 = st.columns(2)
+    
+    with col_chart1:
+        sparkline_chart('Heart Rate', st.session_state.heart_rate_raw[-20:])
+    
+    with col_chart2:
+        sparkline_chart('Accelerometer', st.session_state.accelerometer_raw[-20:])
+
+# ----------------------------------------------------------------------
+# SECTION 2: SMARTWATCH SIMULATION PAGE
+# ----------------------------------------------------------------------
+
+def render():
+    if 'live_stream' not in st.session_state:
+        st.session_state.live_stream = True
+    
+    st.title("Smartwatch Simulation")
+    st.markdown("---")
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("### Child Monitor View")
+        
+        # Get watch color based on prediction
+        watch_color = get_watch_color(st.session_state.prediction) if st.session_state.prediction is not None else "#10B981"
+        
+        # Determine which scene to show
+        scene = st.session_state.scenario if st.session_state.scenario else "NORMAL"
+        
+        # Create realistic child illustration HTML with multiple scenes
+        child_html = child_scene_html(scene, watch_color)
+        
+        components.html(child_html, height=650)
+        
+        # Show status with appropriate styling
+        if st.session_state.prediction is not None or st.session_state.scenario:
+            status = st.session_state.scenario if st.session_state.scenario else "NORMAL"
+            if st.session_state.prediction is not None:
+                status = get_prediction_label(st.session_state.prediction)
+            
+            color = {"NORMAL": "#10B981", "PLAYING": "#F59E0B", "DANGER": "#EF4444"}.get(status, "#1E3A8A")
+            
+            st.markdown(f"""
+            <div style="text-align: center; padding: 15px; background-color: {color}; color: white; 
+                        border-radius: 10px; font-weight: bold; font-size: 1.2rem; margin-top: 10px;
+                        box-shadow: 0 4px 10px rgba(0,0,0,0.2);
+                        animation: {'pulse 1s infinite' if status == 'DANGER' else 'none'};">
+                Current Status: {status} 
+                <span style="font-size: 1.5rem; margin-left: 10px;">
+                    {'🟢' if status == 'NORMAL' else '🟡' if status == 'PLAYING' else '🔴🚨'}
+                </span>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Scenario Controls")
+        st.markdown("Select an activity scenario to simulate:")
+        
+        # Scenario buttons with icons
+        col_btn1, col_btn2, col_btn3 = st.columns(3)
+        
+        with col_btn1:
+            if st.button("🟢 NORMAL", key="normal", use_container_width=True):
+                hr, acc = generate_sensor_data("NORMAL")
+                st.session_state.heart_rate_raw = hr
+                st.session_state.accelerometer_raw = acc
+                st.session_state.feature_stream = None
+                st.session_state.scenario = "NORMAL"
+                st.session_state.prediction = 0
+                st.session_state.probabilities = None
+                update_alert(0.0)
+                log_event("SCENARIO", "Normal activity selected")
+                st.rerun()
+        
+        with col_btn2:
+            if st.button("🟡 PLAYING", key="playing", use_container_width=True):
+                hr, acc = generate_sensor_data("PLAYING")
+                st.session_state.heart_rate_raw = hr
+                st.session_state.accelerometer_raw = acc
+                st.session_state.feature_stream = None
+                st.session_state.scenario = "PLAYING"
+                st.session_state.prediction = 1
+                st.session_state.probabilities = None
+                update_alert(0.0)
+                log_event("SCENARIO", "Playing activity selected")
+                st.rerun()
+        
+        with col_btn3:
+            if st.button("🔴 DANGER", key="danger", use_container_width=True):
+                hr, acc = generate_sensor_data("DANGER")
+                st.session_state.heart_rate_raw = hr
+                st.session_state.accelerometer_raw = acc
+                st.session_state.feature_stream = None
+                st.session_state.scenario = "DANGER"
+                st.session_state.prediction = 2
+                st.session_state.probabilities = None
+                update_alert(1.0)
+                log_event("SCENARIO", "Danger scenario selected")
+                st.rerun()
+        
+        st.markdown("---")
+        
+        # Real-time vital signs monitor
+        if st.session_state.heart_rate_raw and st.session_state.accelerometer_raw:
+            st.toggle("Live sensor stream", key="live_stream")
+            run_every = SENSOR_TICK_SECONDS if st.session_state.live_stream else None
+            st.fragment(run_every=run_every)(live_vitals_panel)()
+        else:
+            # Placeholder
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 40px; border-radius: 15px; color: white; text-align: center;">
+                <h3 style="color: white;">👆 Click a scenario button</h3>
+                <p>Generate sensor data to begin monitoring</p>
+            </div>
+            """, unsafe_allow_html=True)